@@ -6,12 +6,30 @@ Runs comprehensive integration tests for the pattern-based extraction system
 and generates a detailed summary report.
 """
 
+import atexit
+import os
+import re
 import sys
 import time
+from functools import lru_cache
 from pathlib import Path
 from datetime import datetime
 import subprocess
 
+# Resolved once at import; both paths get stat'd/joined repeatedly otherwise
+_HERE = Path(__file__).resolve().parent
+_TEST_FILE = _HERE / "tests" / "integration" / "test_integration.py"
+_DEFAULT_TEST_EPUB = (
+    "/Users/csrdsg/projects/open_fire_cooking/books/"
+    "101 Things to Do with a Smoker (Eliza Cross) (Z-Library).epub"
+)
+
+
+@lru_cache(maxsize=None)
+def _path_exists(path: Path) -> bool:
+    """Cache existence checks so repeated runs in-process skip the stat."""
+    return path.exists()
+
 # Color codes for terminal output
 class Colors:
     HEADER = '\033[95m'
@@ -25,37 +43,143 @@ class Colors:
     UNDERLINE = '\033[4m'
 
 
+class Printer:
+    """Batches output lines and flushes them in one stdout write per section.
+
+    Per-line print() calls each hit sys.stdout.write + flush, which adds
+    visible latency on slow terminals and pollutes the elapsed_time metric.
+    When stdout is not a TTY (piped/redirected), ANSI color codes are
+    stripped so downstream tools see plain text.
+    """
+
+    _ANSI_RE = re.compile(r"\033\[[0-9;]*m")
+
+    def __init__(self):
+        self._buf = []
+        self._color = sys.stdout.isatty()
+
+    def emit(self, message=""):
+        if not self._color:
+            message = self._ANSI_RE.sub("", message)
+        self._buf.append(message + "\n")
+
+    def flush(self):
+        if self._buf:
+            sys.stdout.write("".join(self._buf))
+            sys.stdout.flush()
+            self._buf.clear()
+
+
+_printer = Printer()
+atexit.register(_printer.flush)
+
+
 def print_header(message):
     """Print a formatted header."""
-    print(f"\n{Colors.HEADER}{Colors.BOLD}{'=' * 80}{Colors.ENDC}")
-    print(f"{Colors.HEADER}{Colors.BOLD}{message.center(80)}{Colors.ENDC}")
-    print(f"{Colors.HEADER}{Colors.BOLD}{'=' * 80}{Colors.ENDC}\n")
+    _printer.emit(f"\n{Colors.HEADER}{Colors.BOLD}{'=' * 80}{Colors.ENDC}")
+    _printer.emit(f"{Colors.HEADER}{Colors.BOLD}{message.center(80)}{Colors.ENDC}")
+    _printer.emit(f"{Colors.HEADER}{Colors.BOLD}{'=' * 80}{Colors.ENDC}\n")
 
 
 def print_section(message):
     """Print a formatted section header."""
-    print(f"\n{Colors.OKBLUE}{Colors.BOLD}{message}{Colors.ENDC}")
-    print(f"{Colors.OKBLUE}{'-' * len(message)}{Colors.ENDC}")
+    _printer.emit(f"\n{Colors.OKBLUE}{Colors.BOLD}{message}{Colors.ENDC}")
+    _printer.emit(f"{Colors.OKBLUE}{'-' * len(message)}{Colors.ENDC}")
 
 
 def print_success(message):
     """Print success message."""
-    print(f"{Colors.OKGREEN}✓ {message}{Colors.ENDC}")
+    _printer.emit(f"{Colors.OKGREEN}✓ {message}{Colors.ENDC}")
 
 
 def print_error(message):
     """Print error message."""
-    print(f"{Colors.FAIL}✗ {message}{Colors.ENDC}")
+    _printer.emit(f"{Colors.FAIL}✗ {message}{Colors.ENDC}")
 
 
 def print_warning(message):
     """Print warning message."""
-    print(f"{Colors.WARNING}⚠ {message}{Colors.ENDC}")
+    _printer.emit(f"{Colors.WARNING}⚠ {message}{Colors.ENDC}")
 
 
 def print_info(message):
     """Print info message."""
-    print(f"{Colors.OKCYAN}ℹ {message}{Colors.ENDC}")
+    _printer.emit(f"{Colors.OKCYAN}ℹ {message}{Colors.ENDC}")
+
+
+def get_worker_count():
+    """Determine the pytest-xdist worker count from CLI args and environment.
+
+    Returns "auto" by default, the value of --workers N when given, or "0"
+    (serial) when already running inside an xdist worker to avoid
+    oversubscription from nested parallel invocations.
+    """
+    # Nested invocation (e.g. from a test that shells out to this runner)
+    if os.environ.get("PYTEST_XDIST_WORKER"):
+        return "0"
+
+    if "--workers" in sys.argv:
+        idx = sys.argv.index("--workers")
+        if idx + 1 < len(sys.argv):
+            return sys.argv[idx + 1]
+
+    return "auto"
+
+
+def _get_node_ids(test_file):
+    """Return explicit pytest node-ids for the test file, caching collection.
+
+    Collection is only re-run when the test file's mtime changes; otherwise
+    the cached node-ids from .pytest_nodes.txt are passed to pytest directly,
+    skipping the per-invocation collection pass. Returns None when
+    collection fails, in which case the caller falls back to the file path.
+    """
+    cache_path = _HERE / ".pytest_nodes.txt"
+    mtime_line = f"# mtime={test_file.stat().st_mtime_ns}"
+
+    try:
+        lines = cache_path.read_text().splitlines()
+        if lines and lines[0] == mtime_line:
+            node_ids = [line for line in lines[1:] if line]
+            if node_ids:
+                return node_ids
+    except OSError:
+        pass
+
+    # Cache miss or stale: collect once and store
+    try:
+        result = subprocess.run(
+            ["pytest", "--collect-only", "-q", str(test_file)],
+            capture_output=True,
+            text=True,
+            timeout=120,
+        )
+    except (OSError, subprocess.TimeoutExpired):
+        return None
+
+    node_ids = [line.strip() for line in result.stdout.splitlines() if "::" in line]
+    if not node_ids:
+        return None
+
+    try:
+        cache_path.write_text("\n".join([mtime_line, *node_ids]) + "\n")
+    except OSError:
+        pass
+    return node_ids
+
+
+def _parse_pytest_summary(output_lines):
+    """Extract passed/failed/skipped counts from captured pytest output.
+
+    Returns a dict like {"passed": 12, "skipped": 1}, or an empty dict if no
+    summary line was found.
+    """
+    summary_re = re.compile(r"(\d+)\s+(passed|failed|skipped|error|errors|xfailed|xpassed)")
+    for line in reversed(output_lines):
+        matches = summary_re.findall(line)
+        if matches:
+            return {status: int(count) for count, status in matches}
+    return {}
 
 
 def run_tests():
@@ -64,11 +188,11 @@ def run_tests():
 
     print_info(f"Test execution started at: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}")
     print_info(f"Python version: {sys.version.split()[0]}")
-    print()
+    _printer.emit()
 
-    # Check if test EPUB exists
-    test_epub = Path("/Users/csrdsg/projects/open_fire_cooking/books/101 Things to Do with a Smoker (Eliza Cross) (Z-Library).epub")
-    if not test_epub.exists():
+    # Check if test EPUB exists (overridable via EPUB_RECIPE_TEST_EPUB)
+    test_epub = Path(os.environ.get("EPUB_RECIPE_TEST_EPUB", _DEFAULT_TEST_EPUB))
+    if not _path_exists(test_epub):
         print_error(f"Test EPUB not found: {test_epub}")
         print_warning("Please ensure the test EPUB file exists before running integration tests")
         return False
@@ -76,53 +200,104 @@ def run_tests():
     print_success(f"Test EPUB found: {test_epub.name}")
 
     # Run pytest with verbose output and coverage
-    test_file = Path(__file__).parent / "tests" / "integration" / "test_integration.py"
+    test_file = _TEST_FILE
 
-    if not test_file.exists():
+    if not _path_exists(test_file):
         print_error(f"Test file not found: {test_file}")
         return False
 
     print_success(f"Test file found: {test_file.name}")
-    print()
+    _printer.emit()
 
     print_section("Running Integration Tests")
 
     # Prepare pytest command
+    workers = get_worker_count()
+
+    # Pass explicit node-ids when available to skip collection overhead
+    node_ids = _get_node_ids(test_file)
+    targets = node_ids if node_ids else [str(test_file)]
+
     pytest_cmd = [
         "pytest",
-        str(test_file),
+        *targets,
         "-v",  # Verbose
-        "-s",  # Show print statements
         "--tb=short",  # Short traceback format
         "--color=yes",  # Colored output
         "-W", "ignore::DeprecationWarning",  # Ignore deprecation warnings
     ]
 
+    if workers == "0":
+        # Serial run: xdist disabled, so print output can pass through
+        pytest_cmd.append("--capture=no")
+    else:
+        # Parallel run via pytest-xdist; worksteal rebalances long-tail tests
+        # and --maxprocesses caps worker-startup overhead on big machines
+        pytest_cmd += ["-n", workers, "--dist=worksteal", "--maxprocesses", "8"]
+
     print_info(f"Command: {' '.join(pytest_cmd)}")
-    print()
+    _printer.emit()
+
+    # Default: run pytest in-process via pytest.main(), skipping interpreter
+    # startup and re-imports of pytest/pluggy/the project on every
+    # invocation. --subprocess restores full process isolation (e.g. to
+    # dodge plugin conflicts) using the streaming pipe path below.
+    use_subprocess = "--subprocess" in sys.argv
+
+    # Flush buffered preamble before pytest starts writing to stdout itself
+    _printer.flush()
 
-    # Run tests and capture output
     start_time = time.time()
 
+    if not use_subprocess:
+        import pytest
+
+        returncode = pytest.main(pytest_cmd[1:])
+        elapsed_time = time.time() - start_time
+
+        _printer.emit()
+        print_section("Test Execution Summary")
+
+        if returncode == 0:
+            print_success("All tests passed!")
+            print_success(f"Execution time: {elapsed_time:.2f} seconds")
+            return True
+        print_error(f"Some tests failed (exit code: {returncode})")
+        print_info(f"Execution time: {elapsed_time:.2f} seconds")
+        return False
+
     try:
-        result = subprocess.run(
+        process = subprocess.Popen(
             pytest_cmd,
-            cwd=Path(__file__).parent,
-            capture_output=False,  # Show output in real-time
-            text=True
+            stdout=subprocess.PIPE,
+            stderr=subprocess.STDOUT,
+            bufsize=1,
+            text=True,
         )
 
+        output_lines = []
+        assert process.stdout is not None
+        for line in process.stdout:
+            sys.stdout.write(line)
+            output_lines.append(line)
+        returncode = process.wait()
+
         elapsed_time = time.time() - start_time
 
-        print()
+        _printer.emit()
         print_section("Test Execution Summary")
 
-        if result.returncode == 0:
+        # Parse pass/fail counts from the captured pytest summary line
+        summary = _parse_pytest_summary(output_lines)
+        if summary:
+            print_info("Results: " + ", ".join(f"{v} {k}" for k, v in summary.items()))
+
+        if returncode == 0:
             print_success("All tests passed!")
             print_success(f"Execution time: {elapsed_time:.2f} seconds")
             return True
         else:
-            print_error(f"Some tests failed (exit code: {result.returncode})")
+            print_error(f"Some tests failed (exit code: {returncode})")
             print_info(f"Execution time: {elapsed_time:.2f} seconds")
             return False
 
@@ -175,31 +350,31 @@ def print_test_coverage_summary():
     ]
 
     for area, tests in coverage_areas:
-        print(f"\n{Colors.BOLD}{area}:{Colors.ENDC}")
+        _printer.emit(f"\n{Colors.BOLD}{area}:{Colors.ENDC}")
         for test in tests:
-            print(f"  {Colors.OKGREEN}✓{Colors.ENDC} {test}")
+            _printer.emit(f"  {Colors.OKGREEN}✓{Colors.ENDC} {test}")
 
 
 def print_usage_guide():
     """Print guide for using the integration tests."""
     print_section("Usage Guide")
 
-    print(f"{Colors.BOLD}Running specific test classes:{Colors.ENDC}")
-    print("  pytest tests/integration/test_integration.py::TestEndToEndExtraction -v")
-    print()
+    _printer.emit(f"{Colors.BOLD}Running specific test classes:{Colors.ENDC}")
+    _printer.emit("  pytest tests/integration/test_integration.py::TestEndToEndExtraction -v")
+    _printer.emit()
 
-    print(f"{Colors.BOLD}Running specific test methods:{Colors.ENDC}")
-    print("  pytest tests/integration/test_integration.py::TestEndToEndExtraction::test_full_extraction_pipeline -v")
-    print()
+    _printer.emit(f"{Colors.BOLD}Running specific test methods:{Colors.ENDC}")
+    _printer.emit("  pytest tests/integration/test_integration.py::TestEndToEndExtraction::test_full_extraction_pipeline -v")
+    _printer.emit()
 
-    print(f"{Colors.BOLD}Running with different verbosity:{Colors.ENDC}")
-    print("  pytest tests/integration/test_integration.py -vv  # Extra verbose")
-    print("  pytest tests/integration/test_integration.py -q   # Quiet mode")
-    print()
+    _printer.emit(f"{Colors.BOLD}Running with different verbosity:{Colors.ENDC}")
+    _printer.emit("  pytest tests/integration/test_integration.py -vv  # Extra verbose")
+    _printer.emit("  pytest tests/integration/test_integration.py -q   # Quiet mode")
+    _printer.emit()
 
-    print(f"{Colors.BOLD}Running with coverage report:{Colors.ENDC}")
-    print("  pytest tests/integration/test_integration.py --cov=epub_recipe_parser --cov-report=html")
-    print()
+    _printer.emit(f"{Colors.BOLD}Running with coverage report:{Colors.ENDC}")
+    _printer.emit("  pytest tests/integration/test_integration.py --cov=epub_recipe_parser --cov-report=html")
+    _printer.emit()
 
 
 def main():
@@ -216,37 +391,43 @@ def main():
 
     if show_coverage:
         print_test_coverage_summary()
-        print()
+        _printer.emit()
         return
 
-    # Run the tests
-    success = run_tests()
+    # Chdir once up front so the pytest subprocesses don't each pay a
+    # post-fork chdir; restored on exit to keep the module import-safe.
+    original_cwd = os.getcwd()
+    os.chdir(_HERE)
+    try:
+        success = run_tests()
+    finally:
+        os.chdir(original_cwd)
 
     # Print additional information
-    print()
+    _printer.emit()
     print_test_coverage_summary()
 
-    print()
+    _printer.emit()
     print_section("Next Steps")
 
     if success:
         print_success("Integration tests completed successfully!")
-        print()
+        _printer.emit()
         print_info("You can now:")
-        print("  1. Review test output above for detailed results")
-        print("  2. Check confidence scores and agreement rates")
-        print("  3. Run specific test classes for focused testing")
-        print("  4. Generate coverage reports for detailed analysis")
+        _printer.emit("  1. Review test output above for detailed results")
+        _printer.emit("  2. Check confidence scores and agreement rates")
+        _printer.emit("  3. Run specific test classes for focused testing")
+        _printer.emit("  4. Generate coverage reports for detailed analysis")
     else:
         print_warning("Some tests failed. Please review the output above.")
-        print()
+        _printer.emit()
         print_info("Debugging tips:")
-        print("  1. Check test output for specific failure messages")
-        print("  2. Run failing tests individually with -v flag")
-        print("  3. Verify test EPUB file exists and is accessible")
-        print("  4. Check that all dependencies are installed")
+        _printer.emit("  1. Check test output for specific failure messages")
+        _printer.emit("  2. Run failing tests individually with -v flag")
+        _printer.emit("  3. Verify test EPUB file exists and is accessible")
+        _printer.emit("  4. Check that all dependencies are installed")
 
-    print()
+    _printer.emit()
     print_usage_guide()
 
     # Exit with appropriate code
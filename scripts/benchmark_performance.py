@@ -4,21 +4,565 @@
 Compares execution time and extraction quality between legacy and pattern-based methods.
 """
 
+import os
+import queue
+import threading
 import time
 import sys
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
 from typing import List, Tuple
 from dataclasses import dataclass
+from statistics import fmean
 from bs4 import BeautifulSoup
 
+from epub_recipe_parser.__version__ import __version__ as EXTRACTOR_VERSION
+from epub_recipe_parser.core import EPUBRecipeExtractor, ExtractorConfig
 from epub_recipe_parser.extractors.ingredients import IngredientsExtractor
 from epub_recipe_parser.extractors.instructions import InstructionsExtractor
 from epub_recipe_parser.extractors.metadata import MetadataExtractor
 
 
-@dataclass
+def _extract_one(path_str: str) -> Tuple[str, int, float]:
+    """Extract one EPUB in a worker process.
+
+    Module-level so it is picklable by ProcessPoolExecutor. Builds its own
+    extractor because instances don't cross process boundaries.
+
+    Returns:
+        Tuple of (path, recipe count, worker-side elapsed seconds)
+    """
+    start = time.perf_counter()
+    config = ExtractorConfig(min_quality_score=20)
+    extractor = EPUBRecipeExtractor(config=config)
+    recipes = extractor.extract_from_epub(path_str)
+    return (path_str, len(recipes), time.perf_counter() - start)
+
+
+def profile_extraction(extractor: EPUBRecipeExtractor, epub_path: str | Path) -> dict:
+    """Run one clean timed extraction pass (no profiler attached).
+
+    Kept profiler-free so elapsed_time and recipes_per_second carry no
+    instrumentation tax; use _collect_profile for the diagnostic stats dump.
+    The extractor is passed in so construction cost stays out of the timing.
+    """
+    start = time.perf_counter()
+    recipes = extractor.extract_from_epub(str(epub_path))
+    elapsed = time.perf_counter() - start
+
+    return {
+        "elapsed_time": elapsed,
+        "recipe_count": len(recipes),
+        "recipes_per_second": len(recipes) / elapsed if elapsed > 0 else 0.0,
+    }
+
+
+def _collect_profile(extractor: EPUBRecipeExtractor, epub_path: str | Path) -> Tuple[str, str]:
+    """Run one profiled extraction pass and return (profiler kind, dump path).
+
+    The timings of this pass are discarded — it exists only to attribute
+    where time goes. The default profiler is pyinstrument's statistical
+    sampler, which avoids cProfile's deterministic per-call overhead; set
+    BENCH_PROFILER=cprofile to opt back into cProfile (also the fallback
+    when pyinstrument isn't installed).
+
+    The stats text is streamed to a tempfile rather than returned as a
+    string, so long benchmark sweeps don't hold every dump in memory and
+    the files survive the run for later diffing.
+    """
+    import tempfile
+
+    profiler_kind = os.environ.get("BENCH_PROFILER", "sampling")
+
+    if profiler_kind == "sampling":
+        try:
+            from pyinstrument import Profiler
+        except ImportError:
+            profiler_kind = "cprofile"
+        else:
+            p = Profiler(interval=0.001)
+            p.start()
+            extractor.extract_from_epub(str(epub_path))
+            p.stop()
+            with tempfile.NamedTemporaryFile(
+                "w", suffix=".pyinstrument.txt", delete=False
+            ) as f:
+                f.write(p.output_text(unicode=True, color=False))
+            return profiler_kind, f.name
+
+    import cProfile
+    import pstats
+
+    profiler = cProfile.Profile()
+    profiler.enable()
+    extractor.extract_from_epub(str(epub_path))
+    profiler.disable()
+    with tempfile.NamedTemporaryFile("w", suffix=".pstats.txt", delete=False) as f:
+        ps = pstats.Stats(profiler, stream=f)
+        # Restrict to project frames so stdlib noise (zipfile, re, pathlib)
+        # doesn't bury the actionable hotspots
+        ps.sort_stats(pstats.SortKey.CUMULATIVE)
+        ps.print_stats(r"epub_recipe_parser", 20)
+        ps.sort_stats(pstats.SortKey.TIME)
+        ps.print_stats(r"epub_recipe_parser", 10)
+        ps.print_callers(r"epub_recipe_parser", 10)
+    return "cprofile", f.name
+
+
+def analyze_bottlenecks(epub_path: str | Path, track_memory: bool = False) -> dict:
+    """Profile one extraction pass and report where time (and memory) goes.
+
+    CPU attribution reuses _collect_profile. With track_memory=True the
+    pass also runs under tracemalloc and reports the top allocating source
+    lines as a snapshot delta plus the traced peak — in BeautifulSoup/lxml
+    parsing the allocation hotspots are often the real cost driver that a
+    CPU profile alone doesn't show. The pass is diagnostic-only; tracemalloc
+    slows execution considerably, so no timings are reported from it.
+    """
+    print("\n" + "=" * 70)
+    print("Bottleneck Analysis")
+    print("=" * 70)
+    print(f"EPUB: {Path(epub_path).name}")
+
+    extractor = EPUBRecipeExtractor(config=ExtractorConfig(min_quality_score=20))
+
+    memory_top: List[dict] = []
+    peak = 0
+    if track_memory:
+        import tracemalloc
+
+        tracemalloc.start(25)
+        snapshot_before = tracemalloc.take_snapshot()
+
+    profiler_kind, profile_path = _collect_profile(extractor, epub_path)
+
+    if track_memory:
+        snapshot_after = tracemalloc.take_snapshot()
+        _, peak = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+        for stat in snapshot_after.compare_to(snapshot_before, "lineno")[:10]:
+            frame = stat.traceback[0]
+            memory_top.append(
+                {
+                    "location": f"{frame.filename}:{frame.lineno}",
+                    "size_kb": stat.size_diff / 1024,
+                    "count": stat.count_diff,
+                }
+            )
+
+    print(f"\nCPU profile ({profiler_kind}) written to {profile_path}")
+
+    if track_memory:
+        print("Top allocation deltas:")
+        for entry in memory_top:
+            print(
+                f"  {entry['size_kb']:>10.1f} KiB  "
+                f"({entry['count']:+d} blocks)  {entry['location']}"
+            )
+        print(f"\n  Traced peak: {peak / (1 << 20):.1f} MiB")
+
+    return {
+        "profiler": profiler_kind,
+        "profile_path": profile_path,
+        "memory_top": memory_top,
+        "traced_peak_bytes": peak,
+    }
+
+
+def _timed_run(epub_path_str: str) -> Tuple[float, int]:
+    """One isolated timed extraction for parallel runs (picklable boundary)."""
+    start = time.perf_counter()
+    extractor = EPUBRecipeExtractor(config=ExtractorConfig(min_quality_score=20))
+    count = len(extractor.extract_from_epub(epub_path_str))
+    return (time.perf_counter() - start, count)
+
+
+def benchmark_single_file(
+    epub_path: str | Path,
+    runs: int = 3,
+    parallel: bool = False,
+    json_path: str | Path | None = None,
+) -> dict:
+    """Benchmark repeated extraction of one EPUB.
+
+    All `runs` timed passes run without any profiler so min/avg/max reflect
+    real throughput; a single profiled pass follows for the stats dump
+    (measure first, then diagnose). The extractor is built once and a
+    warmup extraction runs before the timing loop so lazy one-time setup
+    (compiled patterns, caches) doesn't inflate min_time.
+
+    With parallel=True, runs fan out to one worker process each (up to core
+    count), so large sample counts finish in O(runs/cores) wall time. Note
+    that parallel runs measure throughput under contention, not latency —
+    keep the sequential default for latency-sensitive analysis.
+    """
+    print("\n" + "=" * 70)
+    print("Benchmarking Single-File Extraction")
+    print("=" * 70)
+    print(f"EPUB: {Path(epub_path).name}")
+
+    extractor = EPUBRecipeExtractor(config=ExtractorConfig(min_quality_score=20))
+
+    # Warmup: populate lazy caches before the measured runs
+    print("Warming up...")
+    extractor.extract_from_epub(str(epub_path))
+
+    mode = "parallel (throughput under contention)" if parallel else "sequential"
+    print(f"Running {runs} timed passes ({mode})...\n")
+
+    results = []
+    if parallel:
+        max_workers = min(runs, os.cpu_count() or 1)
+        with ProcessPoolExecutor(max_workers=max_workers) as ex:
+            timed = list(ex.map(_timed_run, [str(epub_path)] * runs))
+        for i, (elapsed, count) in enumerate(timed):
+            result = {
+                "elapsed_time": elapsed,
+                "recipe_count": count,
+                "recipes_per_second": count / elapsed if elapsed > 0 else 0.0,
+            }
+            results.append(result)
+            print(
+                f"  Run {i+1}: {result['elapsed_time']:.3f}s "
+                f"({result['recipe_count']} recipes, "
+                f"{result['recipes_per_second']:.1f} recipes/s)"
+            )
+    else:
+        for i in range(runs):
+            result = profile_extraction(extractor, epub_path)
+            results.append(result)
+            print(
+                f"  Run {i+1}: {result['elapsed_time']:.3f}s "
+                f"({result['recipe_count']} recipes, "
+                f"{result['recipes_per_second']:.1f} recipes/s)"
+            )
+
+    times = [r["elapsed_time"] for r in results]
+    min_time = min(times)
+    avg_time = fmean(times)
+    max_time = max(times)
+
+    print("\n" + "-" * 70)
+    print("Results:")
+    print("-" * 70)
+    print(f"  Min:  {min_time:.3f}s")
+    print(f"  Avg:  {avg_time:.3f}s")
+    print(f"  Max:  {max_time:.3f}s")
+
+    # Profiled pass runs once, outside the timed window
+    profiler_kind, profile_path = _collect_profile(extractor, epub_path)
+    print(f"\nProfile ({profiler_kind}) written to {profile_path}")
+
+    summary = {
+        "runs": results,
+        "min_time": min_time,
+        "avg_time": avg_time,
+        "max_time": max_time,
+        "throughput": results[0]["recipe_count"] / min_time if min_time > 0 else 0.0,
+        "profiler": profiler_kind,
+        "profile_path": profile_path,
+    }
+    if json_path:
+        _write_json_results(json_path, summary)
+    return summary
+
+
+def _pin_cpus(spec: str) -> None:
+    """Pin this process to a fixed CPU set to stabilize timing variance.
+
+    `spec` is a comma-separated CPU list (e.g. "0" or "0,2"). Pinning stops
+    the scheduler migrating the benchmark across heterogeneous cores
+    (P/E-cores), which otherwise inflates max_time; the tradeoff is less
+    headroom for background work. No-op on platforms without
+    sched_setaffinity.
+    """
+    if not hasattr(os, "sched_setaffinity"):
+        print("Warning: CPU pinning not supported on this platform")
+        return
+
+    cpus = {int(c) for c in spec.split(",")}
+    os.sched_setaffinity(0, cpus)
+    print(f"Pinned to CPUs: {sorted(cpus)}")
+
+    # Bump priority when we have the privilege to do so
+    try:
+        os.nice(-5)
+    except (OSError, PermissionError):
+        pass
+
+
+def _reapply_affinity(cpus: frozenset) -> None:
+    """Pool initializer: re-apply CPU affinity inside worker processes."""
+    if hasattr(os, "sched_setaffinity"):
+        try:
+            os.sched_setaffinity(0, cpus)
+        except OSError:
+            pass
+
+
+def _write_json_results(json_path: str | Path, payload: dict) -> None:
+    """Dump benchmark results as JSON for regression tracking in CI.
+
+    Adds environment context (git revision, Python version, CPU count) so
+    historical runs can be compared apples-to-apples; see
+    scripts/compare_bench.py for diffing two result files.
+    """
+    import json
+    import platform
+    import subprocess
+
+    try:
+        git_rev = (
+            subprocess.check_output(
+                ["git", "rev-parse", "HEAD"], stderr=subprocess.DEVNULL
+            )
+            .decode()
+            .strip()
+        )
+    except (OSError, subprocess.CalledProcessError):
+        git_rev = None
+
+    payload = {
+        **payload,
+        "git_rev": git_rev,
+        "python_version": platform.python_version(),
+        "cpu_count": os.cpu_count(),
+        "extractor_version": EXTRACTOR_VERSION,
+    }
+    Path(json_path).write_text(json.dumps(payload, indent=2))
+    print(f"\nJSON results written to {json_path}")
+
+
+_BENCH_CACHE_PATH = Path.home() / ".cache" / "epub_recipe_parser" / "bench.json"
+
+
+def _cache_key(path_str: str) -> str:
+    """Cache key for one EPUB: path + mtime + size + extractor version.
+
+    Any file change or parser release invalidates the entry.
+    """
+    import hashlib
+
+    st = os.stat(path_str)
+    raw = f"{path_str}:{st.st_mtime_ns}:{st.st_size}:{EXTRACTOR_VERSION}"
+    return hashlib.blake2b(raw.encode()).hexdigest()
+
+
+def _load_bench_cache() -> dict:
+    import json
+
+    try:
+        return json.loads(_BENCH_CACHE_PATH.read_text())
+    except (OSError, ValueError):
+        return {}
+
+
+def _save_bench_cache(cache: dict) -> None:
+    import json
+
+    _BENCH_CACHE_PATH.parent.mkdir(parents=True, exist_ok=True)
+    _BENCH_CACHE_PATH.write_text(json.dumps(cache))
+
+
+def _load_or_cache_html(epub_path: str, limit: int = 50) -> List[str]:
+    """Return the EPUB's decoded HTML documents, cached on disk between runs.
+
+    Re-running the component benchmarks re-paid the zipfile decode and
+    ebooklib read on every invocation even though none of that is under
+    test. The decoded document strings are pickled next to the bench cache,
+    keyed by path + mtime + size + extractor version (via _cache_key), so
+    repeat runs skip straight to parsing. Raw HTML is cached rather than
+    pickled soups: soups pickle slowly, deeply, and break across bs4
+    releases, while the lxml re-parse is cheap.
+    """
+    import pickle
+
+    cache_file = _BENCH_CACHE_PATH.parent / f"{_cache_key(epub_path)[:16]}.{limit}.html.pkl"
+    try:
+        with open(cache_file, "rb") as f:
+            return pickle.load(f)
+    except (OSError, pickle.PickleError, EOFError):
+        pass
+
+    from ebooklib import epub
+
+    book = epub.read_epub(epub_path)
+    html_docs = [
+        item for item in book.get_items()
+        if item.get_type() == 9  # ITEM_DOCUMENT
+    ]
+    html_list = [
+        doc.get_content().decode('utf-8', errors='ignore') for doc in html_docs[:limit]
+    ]
+
+    try:
+        cache_file.parent.mkdir(parents=True, exist_ok=True)
+        with open(cache_file, "wb") as f:
+            pickle.dump(html_list, f, protocol=pickle.HIGHEST_PROTOCOL)
+    except OSError:
+        pass
+    return html_list
+
+
+def _prefetched(paths: List[str], depth: int):
+    """Yield paths with their bytes read ahead by a background thread.
+
+    The reader pulls each file through the OS page cache up to `depth` files
+    ahead of the consumer, so disk reads for file N+1 overlap with CPU
+    extraction for file N. The bounded queue keeps readahead (and memory)
+    capped at `depth` outstanding files.
+    """
+    q: queue.Queue = queue.Queue(maxsize=depth)
+
+    def reader():
+        for p in paths:
+            try:
+                with open(p, "rb") as f:
+                    while f.read(1 << 20):
+                        pass
+            except OSError:
+                pass  # extraction will surface the real error
+            q.put(p)
+        q.put(None)
+
+    threading.Thread(target=reader, daemon=True).start()
+    while (p := q.get()) is not None:
+        yield p
+
+
+def benchmark_batch(
+    epub_files: List[Path],
+    sequential: bool = False,
+    prefetch: int = 2,
+    cached: bool = False,
+) -> dict:
+    """Benchmark whole-EPUB extraction across multiple files.
+
+    Each EPUB extraction is independent and CPU-bound, so the default mode
+    dispatches files to a process pool (near-linear speedup bounded by core
+    count). Pass sequential=True for a single-process reference run; that
+    path still overlaps I/O with CPU by prefetching up to `prefetch` files
+    ahead of extraction, so cold-cache wall time approaches max(CPU, I/O)
+    instead of CPU + I/O.
+
+    With cached=True, unchanged EPUBs (same mtime, size, and extractor
+    version) are skipped and their previous result reused, tightening the
+    edit-measure loop during optimization work.
+    """
+    print("\n" + "=" * 70)
+    print("Benchmarking Batch Extraction")
+    print("=" * 70)
+
+    paths = [str(p) for p in epub_files]
+    mode = "sequential" if sequential else "parallel"
+    print(f"Processing {len(paths)} EPUB files ({mode})...\n")
+
+    cache = _load_bench_cache() if cached else {}
+    cache_hits = []
+    to_run = []
+    for p in paths:
+        key = _cache_key(p)
+        if cached and key in cache:
+            entry = cache[key]
+            cache_hits.append((p, entry["recipes"], entry["elapsed"]))
+        else:
+            to_run.append((p, key))
+
+    run_paths = [p for p, _ in to_run]
+
+    # Warmup: one throwaway extraction so lazy one-time setup (module-level
+    # pattern compilation, import side effects, OS file cache) is paid before
+    # the clock starts and the measured window reflects steady-state cost.
+    if run_paths:
+        print("Warming up...")
+        _extract_one(run_paths[0])
+
+    wall_start = time.perf_counter()
+
+    if sequential:
+        fresh = [_extract_one(p) for p in _prefetched(run_paths, prefetch)]
+    elif run_paths:
+        max_workers = min(os.cpu_count() or 1, len(run_paths))
+        pool_kwargs = {}
+        if hasattr(os, "sched_getaffinity"):
+            # Workers re-apply the parent's (possibly pinned) CPU set
+            pool_kwargs = {
+                "initializer": _reapply_affinity,
+                "initargs": (frozenset(os.sched_getaffinity(0)),),
+            }
+        with ProcessPoolExecutor(max_workers=max_workers, **pool_kwargs) as ex:
+            fresh = list(ex.map(_extract_one, run_paths, chunksize=4))
+    else:
+        fresh = []
+
+    wall_time = time.perf_counter() - wall_start
+
+    if cached and fresh:
+        key_by_path = dict(to_run)
+        for path_str, count, elapsed in fresh:
+            cache[key_by_path[path_str]] = {"recipes": count, "elapsed": elapsed}
+        _save_bench_cache(cache)
+
+    results = fresh + cache_hits
+    # Sum of worker-side elapsed times approximates aggregate CPU time;
+    # wall/aggregate ratio shows the effective parallel speedup.
+    aggregate_time = sum(elapsed for _, _, elapsed in results)
+    total_recipes = sum(count for _, count, _ in results)
+
+    for path_str, count, elapsed in results:
+        print(f"  {Path(path_str).name}: {count} recipes ({elapsed:.2f}s)")
+
+    print("\n" + "-" * 70)
+    print("BATCH RESULTS")
+    print("-" * 70)
+    print(f"  Mode: {mode}")
+    print(f"  Files: {len(paths)}")
+    print(f"  Total recipes: {total_recipes}")
+    print(f"  Wall time: {wall_time:.2f}s (steady-state, after warmup)")
+    print(f"  Aggregate extraction time: {aggregate_time:.2f}s")
+    if results:
+        print(f"  Steady-state throughput: {len(results) / wall_time:.2f} files/s")
+    if wall_time > 0:
+        print(f"  Effective speedup: {aggregate_time / wall_time:.2f}x")
+    if cached:
+        hit_rate = len(cache_hits) / len(paths) if paths else 0.0
+        print(f"  Cache hit rate: {len(cache_hits)}/{len(paths)} ({hit_rate:.0%})")
+
+    return {
+        "mode": mode,
+        "files": len(paths),
+        "total_recipes": total_recipes,
+        "wall_time": wall_time,
+        "aggregate_time": aggregate_time,
+        "cache_hits": len(cache_hits),
+    }
+
+
+def _time_pass(func, repeats: int = 3) -> float:
+    """Median per-pass seconds for `func` via timeit.
+
+    autorange picks an iteration count large enough for a stable (>= 0.2 s)
+    measurement window, so sub-second passes aren't swamped by timer noise;
+    the median over `repeats` windows rejects scheduler-induced outliers
+    that an arithmetic mean would absorb. timeit also disables gc during
+    timing, keeping collection pauses out of the numbers.
+    """
+    import timeit
+
+    timer = timeit.Timer(func)
+    n_loops, _ = timer.autorange()
+    from statistics import median
+
+    return median(timer.repeat(repeat=repeats, number=n_loops)) / n_loops
+
+
+@dataclass(slots=True, frozen=True)
 class BenchmarkResult:
-    """Results from a single benchmark run."""
+    """Results from a single benchmark run.
+
+    Slots halve per-instance memory and speed attribute access; frozen
+    because results are write-once records.
+    """
     method: str
     component: str
     execution_time: float
@@ -32,9 +576,84 @@ class BenchmarkResult:
 class PerformanceBenchmark:
     """Benchmarks extraction performance."""
 
-    def __init__(self, epub_path: str):
+    def __init__(self, epub_path: str, sample_size: int = 50):
         self.epub_path = epub_path
+        # Documents measured per pass; sweeping this shows O(N) scaling
+        self.sample_size = sample_size
         self.results: List[BenchmarkResult] = []
+        # First-call (cold) seconds per extractor, captured during warmup
+        self.cold_times: dict = {}
+        self._sections: List[Tuple[BeautifulSoup, str, str]] | None = None
+        self._warmed = False
+
+    def setup_sections(self) -> List[Tuple[BeautifulSoup, str, str]]:
+        """Read and parse the test sections once, shared by all components.
+
+        Each benchmark method used to re-read the EPUB and re-parse the same
+        50 documents; with three components that meant three full parse
+        passes before any timing started. The parsed (soup, text, title)
+        tuples are memoized here so the EPUB is read and parsed exactly once
+        per benchmark run; the decoded HTML additionally persists across
+        runs via _load_or_cache_html.
+        """
+        if self._sections is None:
+            sections = []
+            for html_content in _load_or_cache_html(str(self.epub_path), self.sample_size):
+                soup = BeautifulSoup(html_content, 'lxml')
+                # One tree walk per document; the text is threaded through to
+                # every extractor call so nothing re-walks the soup. The join
+                # over .strings produces output identical to get_text() while
+                # skipping its separator-join wrapper.
+                text = "".join(soup.strings)
+                title_elem = soup.find(['h1', 'h2', 'h3'])
+                title = title_elem.get_text(strip=True) if title_elem else "Recipe"
+                sections.append((soup, text, title))
+            self._sections = sections
+        return self._sections
+
+    def _warmup(self) -> None:
+        """Exercise every extractor once before any timed window.
+
+        First calls pay one-time costs — lazy re.compile, attribute lookup
+        caches, lru_cache population — that would otherwise land inside the
+        first timed iteration and skew it. Runs once per benchmark instance.
+
+        Each warmup call is individually timed into cold_times, so reports
+        can show the cold-vs-warm split: the cold number includes the
+        one-time setup tax, the timed windows afterwards measure pure
+        steady-state cost. (Memoizing the extractors themselves was
+        rejected — they take mutable soups, and caching would turn the
+        warm passes into dispatch-only no-ops.)
+        """
+        if self._warmed:
+            return
+        sections = self.setup_sections()
+        if sections:
+            soup, text, title = sections[0]
+            cold_calls = [
+                ("ingredients_legacy", lambda: IngredientsExtractor.extract(soup, text)),
+                ("ingredients_pattern", lambda: IngredientsExtractor.extract_with_patterns(soup, text)),
+                ("instructions_legacy", lambda: InstructionsExtractor.extract(soup, text)),
+                ("instructions_pattern", lambda: InstructionsExtractor.extract_with_patterns(soup, text)),
+                ("metadata_legacy", lambda: MetadataExtractor.extract(soup, text, title)),
+                ("metadata_pattern", lambda: MetadataExtractor.extract_with_patterns(soup, text, title)),
+            ]
+            for name, call in cold_calls:
+                start = time.perf_counter()
+                call()
+                self.cold_times[name] = time.perf_counter() - start
+        self._warmed = True
+
+    def _print_cold_vs_warm(self, component: str, legacy_avg: float, pattern_avg: float,
+                            n_sections: int) -> None:
+        """Report first-call cost next to the warm per-section medians."""
+        legacy_cold = self.cold_times.get(f"{component}_legacy")
+        pattern_cold = self.cold_times.get(f"{component}_pattern")
+        if legacy_cold is None or pattern_cold is None or not n_sections:
+            return
+        print("\nCold vs warm (first call / warm per-section median):")
+        print(f"  Legacy:  {legacy_cold * 1000:.1f}ms / {legacy_avg / n_sections * 1000:.1f}ms")
+        print(f"  Pattern: {pattern_cold * 1000:.1f}ms / {pattern_avg / n_sections * 1000:.1f}ms")
 
     def benchmark_ingredients(self, iterations: int = 3) -> Tuple[BenchmarkResult, BenchmarkResult]:
         """Benchmark ingredient extraction."""
@@ -42,78 +661,60 @@ class PerformanceBenchmark:
         print("Benchmarking Ingredient Extraction")
         print("=" * 70)
 
-        # Load EPUB once
-        from ebooklib import epub
-        book = epub.read_epub(self.epub_path)
-        html_docs = [
-            item for item in book.get_items()
-            if item.get_type() == 9  # ITEM_DOCUMENT
-        ]
-
-        # Prepare test sections
-        test_sections = []
-        for doc in html_docs[:50]:  # Test first 50 documents
-            html_content = doc.get_content().decode('utf-8', errors='ignore')
-            soup = BeautifulSoup(html_content, 'html.parser')
-            text = soup.get_text()
-            test_sections.append((soup, text))
+        self._warmup()
+        test_sections = [(soup, text) for soup, text, _ in self.setup_sections()]
 
         print(f"Testing with {len(test_sections)} HTML sections")
-        print(f"Running {iterations} iterations per method...\n")
+        print(f"Running {iterations} timing windows per method...\n")
 
-        # Benchmark legacy method
+        # Timing and result collection are split: timeit.autorange measures
+        # clean passes (median over `iterations` windows), then one untimed
+        # pass gathers successes and scores without polluting the window
         print("[1/2] Benchmarking legacy extract()...")
-        legacy_times = []
-        legacy_successes = 0
-
-        for i in range(iterations):
-            start = time.perf_counter()
-            for soup, text in test_sections:
-                result = IngredientsExtractor.extract(soup, text)
-                if result:
-                    legacy_successes += 1
-            end = time.perf_counter()
-            legacy_times.append(end - start)
-            print(f"  Iteration {i+1}: {legacy_times[-1]:.3f}s")
-
-        legacy_avg = sum(legacy_times) / len(legacy_times)
-        legacy_success_rate = legacy_successes / (len(test_sections) * iterations)
+        legacy_avg = _time_pass(
+            lambda: [IngredientsExtractor.extract(soup, text) for soup, text in test_sections],
+            repeats=iterations,
+        )
+        print(f"  Median pass: {legacy_avg:.3f}s")
+
+        legacy_successes = sum(
+            1 for soup, text in test_sections if IngredientsExtractor.extract(soup, text)
+        )
+        legacy_success_rate = legacy_successes / len(test_sections)
 
         # Benchmark pattern-based method
         print("\n[2/2] Benchmarking pattern-based extract_with_patterns()...")
-        pattern_times = []
+        pattern_avg = _time_pass(
+            lambda: [
+                IngredientsExtractor.extract_with_patterns(soup, text)
+                for soup, text in test_sections
+            ],
+            repeats=iterations,
+        )
+        print(f"  Median pass: {pattern_avg:.3f}s")
+
         pattern_successes = 0
-        confidences = []
-        linguistic_scores = []
-        combined_scores = []
-
-        for i in range(iterations):
-            start = time.perf_counter()
-            for soup, text in test_sections:
-                result, analysis = IngredientsExtractor.extract_with_patterns(soup, text)
-                if result:
-                    pattern_successes += 1
-                    confidences.append(analysis.get('confidence', 0.0))
-                    linguistic_scores.append(analysis.get('linguistic_score', 0.0))
-                    combined_scores.append(analysis.get('combined_score', 0.0))
-            end = time.perf_counter()
-            pattern_times.append(end - start)
-            print(f"  Iteration {i+1}: {pattern_times[-1]:.3f}s")
-
-        pattern_avg = sum(pattern_times) / len(pattern_times)
-        pattern_success_rate = pattern_successes / (len(test_sections) * iterations)
+        conf_sum = ling_sum = comb_sum = 0.0
+        for soup, text in test_sections:
+            result, analysis = IngredientsExtractor.extract_with_patterns(soup, text)
+            if result:
+                pattern_successes += 1
+                conf_sum += analysis.get('confidence', 0.0)
+                ling_sum += analysis.get('linguistic_score', 0.0)
+                comb_sum += analysis.get('combined_score', 0.0)
+        pattern_success_rate = pattern_successes / len(test_sections)
 
         # Calculate statistics
-        avg_confidence = sum(confidences) / len(confidences) if confidences else 0.0
-        avg_linguistic = sum(linguistic_scores) / len(linguistic_scores) if linguistic_scores else 0.0
-        avg_combined = sum(combined_scores) / len(combined_scores) if combined_scores else 0.0
+        avg_confidence = conf_sum / pattern_successes if pattern_successes else 0.0
+        avg_linguistic = ling_sum / pattern_successes if pattern_successes else 0.0
+        avg_combined = comb_sum / pattern_successes if pattern_successes else 0.0
 
         # Create results
         legacy_result = BenchmarkResult(
             method="legacy",
             component="ingredients",
             execution_time=legacy_avg,
-            success_count=int(legacy_successes / iterations),
+            success_count=legacy_successes,
             total_count=len(test_sections)
         )
 
@@ -121,7 +722,7 @@ class PerformanceBenchmark:
             method="pattern",
             component="ingredients",
             execution_time=pattern_avg,
-            success_count=int(pattern_successes / iterations),
+            success_count=pattern_successes,
             total_count=len(test_sections),
             avg_confidence=avg_confidence,
             avg_linguistic_score=avg_linguistic,
@@ -133,12 +734,12 @@ class PerformanceBenchmark:
         print("Results:")
         print("-" * 70)
         print("Legacy extract():")
-        print(f"  Avg time: {legacy_avg:.3f}s")
+        print(f"  Median pass: {legacy_avg:.3f}s")
         print(f"  Success rate: {legacy_success_rate:.1%}")
         print(f"  Successes: {legacy_result.success_count}/{legacy_result.total_count}")
 
         print("\nPattern-based extract_with_patterns():")
-        print(f"  Avg time: {pattern_avg:.3f}s")
+        print(f"  Median pass: {pattern_avg:.3f}s")
         print(f"  Success rate: {pattern_success_rate:.1%}")
         print(f"  Successes: {pattern_result.success_count}/{pattern_result.total_count}")
         print(f"  Avg confidence: {avg_confidence:.2f}")
@@ -155,6 +756,8 @@ class PerformanceBenchmark:
         else:
             print(f"  Pattern method has {overhead:+.1f}% overhead")
 
+        self._print_cold_vs_warm("ingredients", legacy_avg, pattern_avg, len(test_sections))
+
         self.results.extend([legacy_result, pattern_result])
         return legacy_result, pattern_result
 
@@ -164,73 +767,54 @@ class PerformanceBenchmark:
         print("Benchmarking Instruction Extraction")
         print("=" * 70)
 
-        # Load EPUB once
-        from ebooklib import epub
-        book = epub.read_epub(self.epub_path)
-        html_docs = [
-            item for item in book.get_items()
-            if item.get_type() == 9  # ITEM_DOCUMENT
-        ]
-
-        # Prepare test sections
-        test_sections = []
-        for doc in html_docs[:50]:  # Test first 50 documents
-            html_content = doc.get_content().decode('utf-8', errors='ignore')
-            soup = BeautifulSoup(html_content, 'html.parser')
-            text = soup.get_text()
-            test_sections.append((soup, text))
+        self._warmup()
+        test_sections = [(soup, text) for soup, text, _ in self.setup_sections()]
 
         print(f"Testing with {len(test_sections)} HTML sections")
-        print(f"Running {iterations} iterations per method...\n")
+        print(f"Running {iterations} timing windows per method...\n")
 
         # Benchmark legacy method
         print("[1/2] Benchmarking legacy extract()...")
-        legacy_times = []
-        legacy_successes = 0
-
-        for i in range(iterations):
-            start = time.perf_counter()
-            for soup, text in test_sections:
-                result = InstructionsExtractor.extract(soup, text)
-                if result:
-                    legacy_successes += 1
-            end = time.perf_counter()
-            legacy_times.append(end - start)
-            print(f"  Iteration {i+1}: {legacy_times[-1]:.3f}s")
+        legacy_avg = _time_pass(
+            lambda: [InstructionsExtractor.extract(soup, text) for soup, text in test_sections],
+            repeats=iterations,
+        )
+        print(f"  Median pass: {legacy_avg:.3f}s")
 
-        legacy_avg = sum(legacy_times) / len(legacy_times)
+        legacy_successes = sum(
+            1 for soup, text in test_sections if InstructionsExtractor.extract(soup, text)
+        )
 
         # Benchmark pattern-based method
         print("\n[2/2] Benchmarking pattern-based extract_with_patterns()...")
-        pattern_times = []
+        pattern_avg = _time_pass(
+            lambda: [
+                InstructionsExtractor.extract_with_patterns(soup, text)
+                for soup, text in test_sections
+            ],
+            repeats=iterations,
+        )
+        print(f"  Median pass: {pattern_avg:.3f}s")
+
         pattern_successes = 0
-        confidences = []
-        linguistic_scores = []
-
-        for i in range(iterations):
-            start = time.perf_counter()
-            for soup, text in test_sections:
-                result, analysis = InstructionsExtractor.extract_with_patterns(soup, text)
-                if result:
-                    pattern_successes += 1
-                    confidences.append(analysis.get('confidence', 0.0))
-                    linguistic_scores.append(analysis.get('linguistic_score', 0.0))
-            end = time.perf_counter()
-            pattern_times.append(end - start)
-            print(f"  Iteration {i+1}: {pattern_times[-1]:.3f}s")
-
-        pattern_avg = sum(pattern_times) / len(pattern_times)
+        conf_sum = ling_sum = 0.0
+        for soup, text in test_sections:
+            result, analysis = InstructionsExtractor.extract_with_patterns(soup, text)
+            if result:
+                pattern_successes += 1
+                conf_sum += analysis.get('confidence', 0.0)
+                ling_sum += analysis.get('linguistic_score', 0.0)
 
         # Calculate statistics
-        avg_confidence = sum(confidences) / len(confidences) if confidences else 0.0
-        avg_linguistic = sum(linguistic_scores) / len(linguistic_scores) if linguistic_scores else 0.0
+        avg_confidence = conf_sum / pattern_successes if pattern_successes else 0.0
+        avg_linguistic = ling_sum / pattern_successes if pattern_successes else 0.0
 
         # Create results
         legacy_result = BenchmarkResult(
             method="legacy",
             component="instructions",
             execution_time=legacy_avg,
-            success_count=int(legacy_successes / iterations),
+            success_count=legacy_successes,
             total_count=len(test_sections)
         )
 
@@ -238,7 +822,7 @@ class PerformanceBenchmark:
             method="pattern",
             component="instructions",
             execution_time=pattern_avg,
-            success_count=int(pattern_successes / iterations),
+            success_count=pattern_successes,
             total_count=len(test_sections),
             avg_confidence=avg_confidence,
             avg_linguistic_score=avg_linguistic
@@ -260,6 +844,8 @@ class PerformanceBenchmark:
         else:
             print(f"  Pattern method has {overhead:+.1f}% overhead")
 
+        self._print_cold_vs_warm("instructions", legacy_avg, pattern_avg, len(test_sections))
+
         self.results.extend([legacy_result, pattern_result])
         return legacy_result, pattern_result
 
@@ -269,69 +855,55 @@ class PerformanceBenchmark:
         print("Benchmarking Metadata Extraction")
         print("=" * 70)
 
-        # Load EPUB once
-        from ebooklib import epub
-        book = epub.read_epub(self.epub_path)
-        html_docs = [
-            item for item in book.get_items()
-            if item.get_type() == 9  # ITEM_DOCUMENT
-        ]
-
-        # Prepare test sections
-        test_sections = []
-        test_titles = []
-        for doc in html_docs[:50]:  # Test first 50 documents
-            html_content = doc.get_content().decode('utf-8', errors='ignore')
-            soup = BeautifulSoup(html_content, 'html.parser')
-            text = soup.get_text()
-            # Extract a title for metadata extraction
-            title_elem = soup.find(['h1', 'h2', 'h3'])
-            title = title_elem.get_text(strip=True) if title_elem else "Recipe"
-            test_sections.append((soup, text))
-            test_titles.append(title)
+        self._warmup()
+        sections = self.setup_sections()
+        test_sections = [(soup, text) for soup, text, _ in sections]
+        test_titles = [title for _, _, title in sections]
 
         print(f"Testing with {len(test_sections)} HTML sections")
-        print(f"Running {iterations} iterations per method...\n")
+        print(f"Running {iterations} timing windows per method...\n")
 
         # Benchmark legacy method
         print("[1/2] Benchmarking legacy extract()...")
-        legacy_times = []
-        legacy_field_counts = []
-
-        for i in range(iterations):
-            start = time.perf_counter()
-            for (soup, text), title in zip(test_sections, test_titles):
-                result = MetadataExtractor.extract(soup, text, title)
-                legacy_field_counts.append(len(result))
-            end = time.perf_counter()
-            legacy_times.append(end - start)
-            print(f"  Iteration {i+1}: {legacy_times[-1]:.3f}s")
+        legacy_avg = _time_pass(
+            lambda: [
+                MetadataExtractor.extract(soup, text, title)
+                for (soup, text), title in zip(test_sections, test_titles)
+            ],
+            repeats=iterations,
+        )
+        print(f"  Median pass: {legacy_avg:.3f}s")
 
-        legacy_avg = sum(legacy_times) / len(legacy_times)
-        avg_legacy_fields = sum(legacy_field_counts) / len(legacy_field_counts)
+        avg_legacy_fields = fmean(
+            len(MetadataExtractor.extract(soup, text, title))
+            for (soup, text), title in zip(test_sections, test_titles)
+        )
 
         # Benchmark pattern-based method
         print("\n[2/2] Benchmarking pattern-based extract_with_patterns()...")
-        pattern_times = []
-        pattern_field_counts = []
-        confidences = []
-
-        for i in range(iterations):
-            start = time.perf_counter()
-            for (soup, text), title in zip(test_sections, test_titles):
-                result, analysis = MetadataExtractor.extract_with_patterns(soup, text, title)
-                pattern_field_counts.append(len(result))
-                # Average confidence across fields
-                field_confidences = analysis.get('confidence_scores', {}).values()
-                if field_confidences:
-                    confidences.append(sum(field_confidences) / len(field_confidences))
-            end = time.perf_counter()
-            pattern_times.append(end - start)
-            print(f"  Iteration {i+1}: {pattern_times[-1]:.3f}s")
-
-        pattern_avg = sum(pattern_times) / len(pattern_times)
-        avg_pattern_fields = sum(pattern_field_counts) / len(pattern_field_counts)
-        avg_confidence = sum(confidences) / len(confidences) if confidences else 0.0
+        pattern_avg = _time_pass(
+            lambda: [
+                MetadataExtractor.extract_with_patterns(soup, text, title)
+                for (soup, text), title in zip(test_sections, test_titles)
+            ],
+            repeats=iterations,
+        )
+        print(f"  Median pass: {pattern_avg:.3f}s")
+
+        field_sum = 0
+        conf_sum = 0.0
+        conf_calls = 0
+        for (soup, text), title in zip(test_sections, test_titles):
+            result, analysis = MetadataExtractor.extract_with_patterns(soup, text, title)
+            field_sum += len(result)
+            # Average confidence across fields
+            field_confidences = analysis.get('confidence_scores', {}).values()
+            if field_confidences:
+                conf_sum += fmean(field_confidences)
+                conf_calls += 1
+
+        avg_pattern_fields = field_sum / len(test_sections) if test_sections else 0.0
+        avg_confidence = conf_sum / conf_calls if conf_calls else 0.0
 
         # Create results
         legacy_result = BenchmarkResult(
@@ -368,6 +940,8 @@ class PerformanceBenchmark:
         else:
             print(f"  Pattern method has {overhead:+.1f}% overhead")
 
+        self._print_cold_vs_warm("metadata", legacy_avg, pattern_avg, len(test_sections))
+
         self.results.extend([legacy_result, pattern_result])
         return legacy_result, pattern_result
 
@@ -428,28 +1002,128 @@ class PerformanceBenchmark:
         print("=" * 70)
 
 
-if __name__ == "__main__":
-    epub_path = "/Users/csrdsg/projects/open_fire_cooking/books/101 Things to Do with a Smoker (Eliza Cross) (Z-Library).epub"
-
-    if not Path(epub_path).exists():
-        print(f"Error: EPUB file not found: {epub_path}")
-        sys.exit(1)
+DEFAULT_EPUB_PATH = (
+    "/Users/csrdsg/projects/open_fire_cooking/books/"
+    "101 Things to Do with a Smoker (Eliza Cross) (Z-Library).epub"
+)
+
+
+def _parse_args():
+    """CLI mirroring scripts/multiprocessing_implementation.py's argparse style."""
+    import argparse
+
+    parser = argparse.ArgumentParser(
+        description="EPUB Recipe Parser - Performance Benchmark"
+    )
+    parser.add_argument(
+        "path",
+        nargs="?",
+        default=os.environ.get("EPUB_RECIPE_TEST_EPUB", DEFAULT_EPUB_PATH),
+        help="EPUB file or directory of EPUBs (default: $EPUB_RECIPE_TEST_EPUB)",
+    )
+    parser.add_argument("--pin", metavar="CPUS", help="Pin to a CPU list, e.g. 0,2")
+    parser.add_argument("--runs", type=int, default=3, help="Timed passes per file")
+    parser.add_argument(
+        "--iterations", type=int, default=3, help="Iterations per component benchmark"
+    )
+    parser.add_argument("--parallel", action="store_true", help="Fan runs out to processes")
+    parser.add_argument(
+        "--sequential", action="store_true", help="Batch: single-process reference run"
+    )
+    parser.add_argument("--prefetch", type=int, default=2, help="Batch: readahead depth")
+    parser.add_argument("--cached", action="store_true", help="Batch: reuse unchanged results")
+    parser.add_argument("--no-cache", action="store_true", help="Batch: ignore result cache")
+    parser.add_argument("--json", metavar="FILE", help="Write results JSON for compare_bench.py")
+    parser.add_argument(
+        "--bottlenecks", action="store_true", help="Single file: profile-only analysis pass"
+    )
+    parser.add_argument(
+        "--memory", action="store_true", help="With --bottlenecks: tracemalloc deltas"
+    )
+    parser.add_argument(
+        "--components",
+        action="store_true",
+        help="Single file: legacy-vs-pattern component benchmarks",
+    )
+    parser.add_argument(
+        "--sample-size",
+        type=int,
+        default=50,
+        help="Documents measured per component pass (sweep to see O(N) scaling)",
+    )
+    parser.add_argument(
+        "--only",
+        choices=["ingredients", "instructions", "metadata"],
+        help="With --components: run a single component",
+    )
+    return parser.parse_args()
 
-    print("=" * 70)
-    print("EPUB RECIPE PARSER - PERFORMANCE BENCHMARK")
-    print("=" * 70)
-    print(f"EPUB: {Path(epub_path).name}")
-    print("Testing: Legacy vs Pattern-based extraction methods")
-    print("=" * 70)
 
-    benchmark = PerformanceBenchmark(epub_path)
+if __name__ == "__main__":
+    cli_args = _parse_args()
+
+    # Pinning applies to every benchmark mode, so handle it first
+    if cli_args.pin:
+        _pin_cpus(cli_args.pin)
+
+    target = Path(cli_args.path)
+
+    if target.is_dir():
+        # scandir carries cached stat info per entry (one readdir pass, no
+        # extra stat RPCs on network filesystems); largest-first ordering
+        # hands the process pool its longest jobs early so no worker is
+        # left finishing a big file alone at the end
+        entries = [
+            e
+            for e in os.scandir(target)
+            if e.name.endswith(".epub") and e.is_file()
+        ]
+        entries.sort(key=lambda e: e.stat().st_size, reverse=True)
+        epub_files = [Path(e.path) for e in entries]
+        if not epub_files:
+            print(f"Error: No EPUB files found in {target}")
+            sys.exit(1)
+        batch_results = benchmark_batch(
+            epub_files,
+            sequential=cli_args.sequential,
+            prefetch=cli_args.prefetch,
+            cached=cli_args.cached and not cli_args.no_cache,
+        )
+        if cli_args.json:
+            _write_json_results(cli_args.json, batch_results)
+        sys.exit(0)
 
-    # Run benchmarks
-    benchmark.benchmark_ingredients(iterations=3)
-    benchmark.benchmark_instructions(iterations=3)
-    benchmark.benchmark_metadata(iterations=3)
+    if not target.is_file():
+        print(f"Error: EPUB file not found: {target}")
+        sys.exit(1)
 
-    # Print summary
-    benchmark.print_summary()
+    if cli_args.bottlenecks:
+        # Profile-only pass; --memory adds tracemalloc allocation deltas
+        analyze_bottlenecks(target, track_memory=cli_args.memory)
+    elif cli_args.components:
+        print("=" * 70)
+        print("EPUB RECIPE PARSER - PERFORMANCE BENCHMARK")
+        print("=" * 70)
+        print(f"EPUB: {target.name}")
+        print("Testing: Legacy vs Pattern-based extraction methods")
+        print("=" * 70)
 
-    print("\nBenchmark complete!")
+        benchmark = PerformanceBenchmark(str(target), sample_size=cli_args.sample_size)
+        component_methods = {
+            "ingredients": benchmark.benchmark_ingredients,
+            "instructions": benchmark.benchmark_instructions,
+            "metadata": benchmark.benchmark_metadata,
+        }
+        selected = [cli_args.only] if cli_args.only else list(component_methods)
+        for name in selected:
+            component_methods[name](iterations=cli_args.iterations)
+        benchmark.print_summary()
+
+        print("\nBenchmark complete!")
+    else:
+        benchmark_single_file(
+            target,
+            runs=cli_args.runs,
+            parallel=cli_args.parallel,
+            json_path=cli_args.json,
+        )
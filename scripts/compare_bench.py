@@ -0,0 +1,68 @@
+#!/usr/bin/env python3
+"""Compare two benchmark result files produced with --json.
+
+Usage:
+    uv run python scripts/compare_bench.py old.json new.json [--threshold PCT]
+
+Exits non-zero when the new min time regresses by more than the threshold
+(default 10%), making it usable as a CI regression gate.
+"""
+
+import json
+import sys
+from pathlib import Path
+
+DEFAULT_THRESHOLD_PCT = 10.0
+
+# Metrics where lower is better, in display order
+_TIME_METRICS = ["min_time", "avg_time", "max_time", "wall_time", "aggregate_time"]
+
+
+def load_results(path: str) -> dict:
+    try:
+        return json.loads(Path(path).read_text())
+    except (OSError, ValueError) as e:
+        print(f"Error reading {path}: {e}")
+        sys.exit(2)
+
+
+def main():
+    args = [a for a in sys.argv[1:] if not a.startswith("--")]
+    if len(args) != 2:
+        print(__doc__)
+        sys.exit(2)
+
+    threshold = DEFAULT_THRESHOLD_PCT
+    if "--threshold" in sys.argv:
+        idx = sys.argv.index("--threshold")
+        if idx + 1 < len(sys.argv):
+            threshold = float(sys.argv[idx + 1])
+
+    old = load_results(args[0])
+    new = load_results(args[1])
+
+    print(f"{'metric':<18} {'old':>10} {'new':>10} {'delta':>10}")
+    print("-" * 52)
+
+    regressed = False
+    for metric in _TIME_METRICS:
+        if metric not in old or metric not in new:
+            continue
+        old_val, new_val = old[metric], new[metric]
+        delta_pct = ((new_val - old_val) / old_val * 100) if old_val else 0.0
+        print(f"{metric:<18} {old_val:>9.3f}s {new_val:>9.3f}s {delta_pct:>+9.1f}%")
+        if metric in ("min_time", "wall_time") and delta_pct > threshold:
+            regressed = True
+
+    for key in ("git_rev", "python_version"):
+        if old.get(key) != new.get(key):
+            print(f"\n{key}: {old.get(key)} -> {new.get(key)}")
+
+    if regressed:
+        print(f"\nREGRESSION: min time slowed by more than {threshold:.0f}%")
+        sys.exit(1)
+    print("\nOK: within threshold")
+
+
+if __name__ == "__main__":
+    main()
@@ -73,22 +73,44 @@ def analyze_data_quality(db_path: Path) -> dict:
 
     results = {}
 
-    # Get total recipe count
-    cursor.execute("SELECT COUNT(*) FROM recipes")
-    total_recipes = cursor.fetchone()[0]
+    # All scalar counts come from a single scan over the table instead of
+    # one COUNT(*) query (and B-tree walk) per statistic
+    cursor.execute(
+        """
+        SELECT
+            COUNT(*),
+            SUM(serves IS NULL OR serves = ''),
+            SUM(serves IS NOT NULL AND serves != ''),
+            SUM(prep_time IS NULL OR prep_time = ''),
+            SUM(prep_time IS NOT NULL AND prep_time != ''),
+            SUM(prep_time IS NOT NULL AND prep_time != ''
+                AND CAST(prep_time AS INTEGER) > 0),
+            SUM(cook_time IS NULL OR cook_time = ''),
+            SUM(cook_time IS NOT NULL AND cook_time != ''),
+            SUM(cook_time IS NOT NULL AND cook_time != ''
+                AND CAST(cook_time AS INTEGER) > 0)
+        FROM recipes
+    """
+    )
+    (
+        total_recipes,
+        serves_null,
+        serves_populated,
+        prep_null,
+        prep_populated,
+        prep_standardized,
+        cook_null,
+        cook_populated,
+        cook_standardized,
+    ) = (value or 0 for value in cursor.fetchone())
     results["total_recipes"] = total_recipes
 
     print(f"\nTotal recipes: {total_recipes}")
 
     # Analyze serves field
     print("\n--- SERVES Field ---")
-    cursor.execute("SELECT COUNT(*) FROM recipes WHERE serves IS NULL OR serves = ''")
-    serves_null = cursor.fetchone()[0]
     serves_null_pct = (serves_null / total_recipes * 100) if total_recipes > 0 else 0
 
-    cursor.execute("SELECT COUNT(*) FROM recipes WHERE serves IS NOT NULL AND serves != ''")
-    serves_populated = cursor.fetchone()[0]
-
     # Check for garbage in serves (non-numeric, non-range values)
     cursor.execute(
         """
@@ -118,13 +140,8 @@ def analyze_data_quality(db_path: Path) -> dict:
 
     # Analyze prep_time field
     print("\n--- PREP_TIME Field ---")
-    cursor.execute("SELECT COUNT(*) FROM recipes WHERE prep_time IS NULL OR prep_time = ''")
-    prep_null = cursor.fetchone()[0]
     prep_null_pct = (prep_null / total_recipes * 100) if total_recipes > 0 else 0
 
-    cursor.execute("SELECT COUNT(*) FROM recipes WHERE prep_time IS NOT NULL AND prep_time != ''")
-    prep_populated = cursor.fetchone()[0]
-
     # Check for non-numeric prep_time (old format)
     cursor.execute(
         """
@@ -140,18 +157,6 @@ def analyze_data_quality(db_path: Path) -> dict:
     )
     prep_non_numeric = cursor.fetchall()
 
-    # Check if values are standardized (all numeric)
-    cursor.execute(
-        """
-        SELECT COUNT(*)
-        FROM recipes
-        WHERE prep_time IS NOT NULL
-        AND prep_time != ''
-        AND CAST(prep_time AS INTEGER) > 0
-    """
-    )
-    prep_standardized = cursor.fetchone()[0]
-
     results["prep_null"] = prep_null
     results["prep_null_pct"] = prep_null_pct
     results["prep_populated"] = prep_populated
@@ -168,13 +173,8 @@ def analyze_data_quality(db_path: Path) -> dict:
 
     # Analyze cook_time field
     print("\n--- COOK_TIME Field ---")
-    cursor.execute("SELECT COUNT(*) FROM recipes WHERE cook_time IS NULL OR cook_time = ''")
-    cook_null = cursor.fetchone()[0]
     cook_null_pct = (cook_null / total_recipes * 100) if total_recipes > 0 else 0
 
-    cursor.execute("SELECT COUNT(*) FROM recipes WHERE cook_time IS NOT NULL AND cook_time != ''")
-    cook_populated = cursor.fetchone()[0]
-
     # Check for non-numeric cook_time (old format)
     cursor.execute(
         """
@@ -190,18 +190,6 @@ def analyze_data_quality(db_path: Path) -> dict:
     )
     cook_non_numeric = cursor.fetchall()
 
-    # Check if values are standardized (all numeric)
-    cursor.execute(
-        """
-        SELECT COUNT(*)
-        FROM recipes
-        WHERE cook_time IS NOT NULL
-        AND cook_time != ''
-        AND CAST(cook_time AS INTEGER) > 0
-    """
-    )
-    cook_standardized = cursor.fetchone()[0]
-
     results["cook_null"] = cook_null
     results["cook_null_pct"] = cook_null_pct
     results["cook_populated"] = cook_populated
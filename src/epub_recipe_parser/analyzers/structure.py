@@ -1,11 +1,52 @@
 """EPUB structure analysis."""
 
+import os
+import re
+import sys
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from typing import Dict
 from dataclasses import dataclass
 import ebooklib
 from ebooklib import epub
 from bs4 import BeautifulSoup
+from lxml import etree
+
+from epub_recipe_parser.utils.epub_zip import DOCUMENT_MEDIA_TYPES, EPUBZipReader
+
+# Report keys are interned once: every per-book report dict then shares the
+# same key objects instead of carrying its own copies, which adds up when
+# thousands of StructureReports are held during library-wide analysis
+_HEADER_KEYS = tuple(sys.intern(f"h{i}") for i in range(1, 7))
+
+# Recipe-indicator keywords, matched with one alternation scan per document
+# instead of one full text scan per keyword
+_INDICATOR_KEYWORDS = tuple(
+    sys.intern(k)
+    for k in (
+        "ingredients",
+        "instructions",
+        "directions",
+        "serves",
+        "yield",
+        "prep time",
+        "cook time",
+    )
+)
+_INDICATOR_RE = re.compile("|".join(re.escape(k) for k in _INDICATOR_KEYWORDS))
+# Bytes twin of the pattern: every keyword is ASCII, so documents can be
+# scanned as raw bytes without a UTF-8 decode or a full str copy
+_INDICATOR_RE_BYTES = re.compile(b"|".join(k.encode() for k in _INDICATOR_KEYWORDS))
+
+# Passing the full tag list to find_all buckets every header in one tree
+# walk instead of six
+_HEADER_TAGS = list(_HEADER_KEYS)
+_HEADER_TAG_SET = frozenset(_HEADER_KEYS)
+
+# Carry this many trailing characters between text fragments so multi-word
+# keywords ("prep time") spanning fragment boundaries still match
+_KEYWORD_CARRY = max(len(k) for k in _INDICATOR_KEYWORDS) - 1
 
 
 @dataclass
@@ -28,9 +69,58 @@ class EPUBStructureAnalyzer:
     """Analyze EPUB internal structure."""
 
     def analyze_structure(self, epub_path: str | Path) -> StructureReport:
-        """Analyze EPUB structure and organization."""
+        """Analyze EPUB structure and organization.
+
+        Streams documents one at a time from the zip container so peak
+        memory stays at a single document; malformed containers fall back
+        to the full ebooklib load.
+        """
         epub_path = Path(epub_path)
 
+        try:
+            return self._analyze_streaming(epub_path)
+        except Exception:
+            return self._analyze_with_ebooklib(epub_path)
+
+    def _analyze_streaming(self, epub_path: Path) -> StructureReport:
+        """Analyze by reading manifest members lazily from the zip."""
+        with EPUBZipReader(epub_path) as reader:
+            title = reader.metadata("title") or epub_path.stem
+            author = reader.metadata("creator") or "Unknown"
+
+            manifest = reader.manifest_items()
+            doc_hrefs = [
+                href for href, media_type in manifest if media_type in DOCUMENT_MEDIA_TYPES
+            ]
+            image_count = sum(1 for _, media_type in manifest if media_type.startswith("image/"))
+            toc_count = reader.toc_entry_count()
+
+            def scan(href):
+                with reader.open(href) as fileobj:
+                    return self._scan_stream(fileobj)
+
+            if len(doc_hrefs) < 4:
+                results = [scan(href) for href in doc_hrefs]
+            else:
+                with ThreadPoolExecutor(max_workers=os.cpu_count()) as executor:
+                    results = list(executor.map(scan, doc_hrefs))
+            header_counts, indicators = self._reduce_scans(results)
+
+            return StructureReport(
+                epub_name=epub_path.name,
+                title=title,
+                author=author,
+                total_items=len(manifest),
+                document_items=len(doc_hrefs),
+                image_items=image_count,
+                toc_entries=toc_count,
+                has_toc=toc_count > 0,
+                header_distribution=header_counts,
+                recipe_indicators=indicators,
+            )
+
+    def _analyze_with_ebooklib(self, epub_path: Path) -> StructureReport:
+        """Analyze via ebooklib's fully materialized book model."""
         try:
             book = epub.read_epub(str(epub_path))
         except Exception as e:
@@ -43,27 +133,33 @@ class EPUBStructureAnalyzer:
         creator_meta = book.get_metadata("DC", "creator")
         author = creator_meta[0][0] if creator_meta else "Unknown"
 
-        # Get all items
-        items = list(book.get_items())
-        doc_items = [item for item in items if item.get_type() == ebooklib.ITEM_DOCUMENT]
-        image_items = [item for item in items if item.get_type() == ebooklib.ITEM_IMAGE]
+        # Classify all items in a single pass
+        doc_type = ebooklib.ITEM_DOCUMENT
+        image_type = ebooklib.ITEM_IMAGE
+        total_items = 0
+        doc_items = []
+        image_items = []
+        for item in book.get_items():
+            total_items += 1
+            item_type = item.get_type()
+            if item_type == doc_type:
+                doc_items.append(item)
+            elif item_type == image_type:
+                image_items.append(item)
 
         # Analyze TOC
         toc = book.toc
         has_toc = bool(toc)
         toc_count = self._count_toc_entries(toc) if toc else 0
 
-        # Analyze header distribution
-        header_dist = self._analyze_headers(doc_items)
-
-        # Check for recipe-specific patterns
-        recipe_indicators = self._detect_recipe_patterns(doc_items)
+        # Analyze header distribution and recipe patterns in one pass
+        header_dist, recipe_indicators = self._scan_documents(doc_items)
 
         return StructureReport(
             epub_name=epub_path.name,
             title=title,
             author=author,
-            total_items=len(items),
+            total_items=total_items,
             document_items=len(doc_items),
             image_items=len(image_items),
             toc_entries=toc_count,
@@ -74,59 +170,112 @@ class EPUBStructureAnalyzer:
 
     @staticmethod
     def _count_toc_entries(toc) -> int:
-        """Count total TOC entries recursively."""
+        """Count total TOC entries with an explicit stack.
+
+        Iterative traversal avoids per-level function-call overhead and the
+        recursion limit on pathologically deep tables of contents.
+        """
+        stack = deque(toc)
         count = 0
-        for item in toc:
+        while stack:
+            item = stack.pop()
+            count += 1
             if isinstance(item, tuple):
-                _, children = item
-                count += 1 + EPUBStructureAnalyzer._count_toc_entries(children)
-            else:
-                count += 1
+                stack.extend(item[1])
         return count
 
     @staticmethod
-    def _analyze_headers(doc_items) -> Dict[str, int]:
-        """Analyze header distribution across documents."""
-        header_counts = {"h1": 0, "h2": 0, "h3": 0, "h4": 0, "h5": 0, "h6": 0}
+    def _scan_content(content: bytes) -> tuple[Dict[str, int], set]:
+        """Parse one document's bytes; return header counts and indicator hits."""
+        header_counts = dict.fromkeys(_HEADER_KEYS, 0)
+        hits: set = set()
+        try:
+            # lxml is several times faster than the pure-Python parser
+            # and this loop is pure parsing, no I/O
+            soup = BeautifulSoup(content, "lxml")
+
+            for header in soup.find_all(_HEADER_TAGS):
+                header_counts[header.name] += 1
+
+            # Scan the raw bytes: the keywords are ASCII, so lowercasing
+            # and matching bytes skips the decode and the extracted-text
+            # allocation (soup.get_text() would build another full copy).
+            # One pass finds every keyword; dedupe so the count stays
+            # "documents containing", not occurrences
+            hits = {match.decode() for match in _INDICATOR_RE_BYTES.findall(content.lower())}
+        except Exception:
+            pass
+        return header_counts, hits
+
+    @staticmethod
+    def _scan_stream(fileobj) -> tuple[Dict[str, int], set]:
+        """Scan one document incrementally via lxml iterparse.
 
-        for item in doc_items:
-            try:
-                content = item.get_content()
-                soup = BeautifulSoup(content, "html.parser")
+        One streaming pass yields both signals: header tags are counted from
+        end events and indicator keywords are matched against each text
+        fragment as it is produced, with a short carry so terms spanning
+        fragment boundaries still hit. Elements are cleared as they complete,
+        so memory stays bounded regardless of document size.
+        """
+        header_counts = dict.fromkeys(_HEADER_KEYS, 0)
+        hits: set = set()
+        carry = ""
+        try:
+            for _, element in etree.iterparse(fileobj, events=("end",), html=True):
+                tag = element.tag
+                if isinstance(tag, str) and tag in _HEADER_TAG_SET:
+                    header_counts[tag] += 1
+                for fragment in (element.text, element.tail):
+                    if fragment:
+                        text = carry + fragment.lower()
+                        hits.update(_INDICATOR_RE.findall(text))
+                        carry = text[-_KEYWORD_CARRY:]
+                element.clear()
+        except Exception:
+            pass
+        return header_counts, hits
 
-                for level in range(1, 7):
-                    headers = soup.find_all(f"h{level}")
-                    header_counts[f"h{level}"] += len(headers)
-            except Exception:
-                continue
+    @staticmethod
+    def _scan_one(item) -> tuple[Dict[str, int], set]:
+        """Scan one ebooklib item (fallback path)."""
+        try:
+            content = item.get_content()
+        except Exception:
+            return dict.fromkeys(_HEADER_KEYS, 0), set()
+        return EPUBStructureAnalyzer._scan_content(content)
 
-        return header_counts
+    @staticmethod
+    def _reduce_scans(results) -> tuple[Dict[str, int], Dict[str, int]]:
+        """Merge per-document scan results into the two report dicts."""
+        header_counts = dict.fromkeys(_HEADER_KEYS, 0)
+        indicators = dict.fromkeys(_INDICATOR_KEYWORDS, 0)
+        for doc_headers, doc_hits in results:
+            for tag, count in doc_headers.items():
+                header_counts[tag] += count
+            for match in doc_hits:
+                indicators[match] += 1
+        return header_counts, indicators
 
     @staticmethod
-    def _detect_recipe_patterns(doc_items) -> Dict[str, int]:
-        """Detect recipe-specific patterns in documents."""
-        indicators = {
-            "ingredients": 0,
-            "instructions": 0,
-            "directions": 0,
-            "serves": 0,
-            "yield": 0,
-            "prep time": 0,
-            "cook time": 0,
-        }
-
-        for item in doc_items:
-            try:
-                content = item.get_content()
-                text = content.decode("utf-8", errors="ignore").lower()
-
-                for indicator in indicators:
-                    if indicator in text:
-                        indicators[indicator] += 1
-            except Exception:
-                continue
-
-        return indicators
+    def _scan_documents(doc_items) -> tuple[Dict[str, int], Dict[str, int]]:
+        """Analyze header distribution and recipe indicators in one pass.
+
+        Parsing HTML is the dominant cost of structure analysis, so each
+        document is parsed exactly once and both the header counts and the
+        recipe-indicator counts come from the same scan; item.get_content()
+        is likewise called exactly once per item, so ebooklib never has to
+        serve the same bytes twice. lxml releases the GIL while parsing, so
+        documents are scanned on a thread pool; tiny books stay on the
+        serial path to skip pool startup.
+        """
+        scan = EPUBStructureAnalyzer._scan_one
+        if len(doc_items) < 4:
+            results = [scan(item) for item in doc_items]
+        else:
+            with ThreadPoolExecutor(max_workers=os.cpu_count()) as executor:
+                results = list(executor.map(scan, doc_items))
+
+        return EPUBStructureAnalyzer._reduce_scans(results)
 
     def print_report(self, report: StructureReport):
         """Print formatted structure report."""
@@ -4,21 +4,123 @@ from pathlib import Path
 from typing import List, Optional
 from dataclasses import dataclass
 from difflib import SequenceMatcher
+from functools import lru_cache
 import re
 from ebooklib import epub
 
 from epub_recipe_parser.core.models import Recipe
+from epub_recipe_parser.utils.epub_zip import EPUBZipReader
 from epub_recipe_parser.utils.patterns import EXCLUDE_KEYWORDS
 
+# RapidFuzz scores in C with SIMD and stays linear where SequenceMatcher can
+# degenerate to quadratic; fall back to difflib when it is not installed
+try:
+    from rapidfuzz import fuzz as _fuzz, process as _process
+except ImportError:
+    _fuzz = None
+    _process = None
+
+# Compiled once at import: these patterns run on every title during TOC
+# extraction and validation
+_BRACKET_PREFIX_RE = re.compile(r"^\[\]")
+# Deletion table for str.translate, replacing a [^\w\s] regex sub: covers
+# the Latin blocks plus General Punctuation (curly quotes, dashes,
+# ellipses), which is where cookbook-title punctuation lives. translate
+# strips it in one C pass with no regex state machine
+_PUNCT_TABLE = {
+    code: None
+    for code in (*range(0x250), *range(0x2000, 0x2070))
+    if not (chr(code).isalnum() or chr(code).isspace() or code == 0x5F)
+}
+# Both alternatives are checked in one automaton pass; match() is used at
+# the call site since the pattern is anchored to the start anyway
+_EXCLUDE_RE = re.compile(r"(?:chapter|part)\s+\d+", re.IGNORECASE)
+
+_FOOD_INDICATORS = (
+    "chicken",
+    "beef",
+    "pork",
+    "lamb",
+    "fish",
+    "salmon",
+    "shrimp",
+    "salad",
+    "soup",
+    "sauce",
+    "bread",
+    "cake",
+    "pie",
+    "cookie",
+    "grilled",
+    "smoked",
+    "roasted",
+    "baked",
+    "fried",
+    "steak",
+    "ribs",
+    "burger",
+    "sandwich",
+    "taco",
+    "pizza",
+)
+
+
+def _trie_pattern(words) -> str:
+    """Build a trie-structured regex pattern matching any of *words*.
+
+    A flat alternation backtracks through every branch sharing a prefix
+    ("grilled|grated" retries "gr" per branch); factoring common prefixes
+    into nested groups lets the engine walk each title character once.
+    """
+    trie: dict = {}
+    for word in words:
+        node = trie
+        for char in word:
+            node = node.setdefault(char, {})
+        node[""] = {}
+
+    def emit(node: dict) -> str:
+        if "" in node and len(node) == 1:
+            return ""
+        alternatives = []
+        optional = False
+        for char, child in sorted(node.items()):
+            if char == "":
+                optional = True
+            else:
+                alternatives.append(re.escape(char) + emit(child))
+        if len(alternatives) == 1 and not optional:
+            return alternatives[0]
+        pattern = "(?:" + "|".join(alternatives) + ")"
+        return pattern + "?" if optional else pattern
+
+    return emit(trie)
+
+
+# Keyword sets collapse into one trie regex each, so a title is scanned
+# once per set instead of once per keyword
+_FOOD_RE = re.compile(_trie_pattern(_FOOD_INDICATORS))
+_EXCLUDE_KEYWORD_RE = re.compile(_trie_pattern(EXCLUDE_KEYWORDS))
+
+# Characters any food keyword can start with; a title disjoint from this
+# set cannot match _FOOD_RE, and isdisjoint rejects it in one C-level pass
+_FOOD_FIRSTCHARS = frozenset(w[0] for w in _FOOD_INDICATORS)
+
 
 @dataclass
 class TOCEntry:
-    """TOC entry data."""
+    """TOC entry data.
+
+    The lowered and normalized forms are computed once at construction so
+    filtering and fuzzy matching never re-run the same string work per pass.
+    """
 
     title: str
     href: Optional[str] = None
     category: Optional[str] = None
     level: int = 0
+    title_lower: str = ""
+    title_norm: str = ""
 
 
 @dataclass
@@ -37,7 +139,36 @@ class TOCAnalyzer:
     """Analyze EPUB Table of Contents."""
 
     def extract_toc_recipes(self, epub_path: str | Path) -> List[TOCEntry]:
-        """Extract potential recipe entries from EPUB TOC."""
+        """Extract potential recipe entries from EPUB TOC.
+
+        Reads only the NCX/nav document straight from the zip container;
+        read_epub would parse every chapter just to reach the TOC. Malformed
+        containers fall back to the full ebooklib load.
+        """
+        try:
+            with EPUBZipReader(epub_path) as reader:
+                toc_tuples = reader.toc_entries()
+        except Exception:
+            return self._extract_toc_with_ebooklib(epub_path)
+
+        recipes = []
+        for title, href, level, category in toc_tuples:
+            title_lower = title.lower()
+            if self.is_likely_recipe(title, title_lower):
+                recipes.append(
+                    TOCEntry(
+                        title=title,
+                        href=href,
+                        category=category,
+                        level=level,
+                        title_lower=title_lower,
+                        title_norm=self._normalize_title(title),
+                    )
+                )
+        return recipes
+
+    def _extract_toc_with_ebooklib(self, epub_path: str | Path) -> List[TOCEntry]:
+        """Extract TOC entries via ebooklib's fully materialized book model."""
         try:
             book = epub.read_epub(str(epub_path))
         except Exception as e:
@@ -50,52 +181,60 @@ class TOCAnalyzer:
 
         recipes = []
 
-        def process_toc_item(item, level=0, parent_category=None):
-            """Recursively process TOC items."""
+        # Explicit-stack traversal: no per-node call frame, and deep or
+        # pathological TOCs cannot hit the recursion limit. Children are
+        # pushed reversed so entries come out in document order.
+        stack = [(item, 0, None) for item in reversed(toc)]
+        while stack:
+            item, level, parent_category = stack.pop()
+
             if isinstance(item, tuple):
                 # Nested structure: (section, children)
                 section, children = item
-                category = section.title if hasattr(section, "title") else None
-
-                # Process children
-                for child in children:
-                    process_toc_item(child, level + 1, category)
-
-            else:
-                # Simple link
-                if hasattr(item, "title"):
-                    title = item.title
-                    href = getattr(item, "href", None)
-
-                    # Filter out obvious non-recipes
-                    if self.is_likely_recipe(title):
-                        recipes.append(
-                            TOCEntry(title=title, href=href, category=parent_category, level=level)
-                        )
-
-        for item in toc:
-            process_toc_item(item)
+                category = getattr(section, "title", None)
+                stack.extend((child, level + 1, category) for child in reversed(children))
+                continue
+
+            # Simple link
+            title = getattr(item, "title", None)
+            if not title:
+                continue
+            title_lower = title.lower()
+
+            # Filter out obvious non-recipes
+            if self.is_likely_recipe(title, title_lower):
+                recipes.append(
+                    TOCEntry(
+                        title=title,
+                        href=getattr(item, "href", None),
+                        category=parent_category,
+                        level=level,
+                        title_lower=title_lower,
+                        title_norm=self._normalize_title(title),
+                    )
+                )
 
         return recipes
 
     @staticmethod
-    def is_likely_recipe(title: str) -> bool:
-        """Determine if TOC entry is likely a recipe."""
-        title_lower = title.lower()
+    @lru_cache(maxsize=100_000)
+    def is_likely_recipe(title: str, title_lower: Optional[str] = None) -> bool:
+        """Determine if TOC entry is likely a recipe.
+
+        Callers that already lowered the title can pass it to avoid the
+        duplicate allocation. The function is pure, so results are cached:
+        section titles repeat heavily across the books of a batch run and
+        hits skip the regex scans entirely.
+        """
+        if title_lower is None:
+            title_lower = title.lower()
 
         # Exclude obvious non-recipes
-        exclude_patterns = [
-            r"^chapter\s+\d+",
-            r"^part\s+\d+",
-        ]
-
-        for pattern in exclude_patterns:
-            if re.search(pattern, title_lower):
-                return False
+        if _EXCLUDE_RE.match(title):
+            return False
 
-        for keyword in EXCLUDE_KEYWORDS:
-            if keyword in title_lower:
-                return False
+        if _EXCLUDE_KEYWORD_RE.search(title_lower):
+            return False
 
         # Too short to be a recipe title
         if len(title) < 3:
@@ -105,37 +244,10 @@ class TOCAnalyzer:
         if title.strip().isdigit():
             return False
 
-        # Likely a recipe if contains food words or is longer
-        food_indicators = [
-            "chicken",
-            "beef",
-            "pork",
-            "lamb",
-            "fish",
-            "salmon",
-            "shrimp",
-            "salad",
-            "soup",
-            "sauce",
-            "bread",
-            "cake",
-            "pie",
-            "cookie",
-            "grilled",
-            "smoked",
-            "roasted",
-            "baked",
-            "fried",
-            "steak",
-            "ribs",
-            "burger",
-            "sandwich",
-            "taco",
-            "pizza",
-        ]
-
-        has_food_word = any(word in title_lower for word in food_indicators)
-        if has_food_word:
+        # Likely a recipe if contains food words or is longer; the
+        # first-char prefilter skips the full keyword scan when no food
+        # word could possibly start in this title
+        if not _FOOD_FIRSTCHARS.isdisjoint(title_lower) and _FOOD_RE.search(title_lower):
             return True
 
         # Or is longer and at deeper level (likely recipe)
@@ -144,6 +256,29 @@ class TOCAnalyzer:
 
         return False
 
+    @staticmethod
+    def _normalize_title(title: str) -> str:
+        """Normalize a title for similarity scoring."""
+        normalized = title.lower().translate(_PUNCT_TABLE)
+        return _BRACKET_PREFIX_RE.sub("", normalized).strip()
+
+    @staticmethod
+    def _score_normalized(s1: str, s2: str) -> float:
+        """Similarity score for titles that are already normalized."""
+        if not s1 or not s2:
+            return 0.0
+        # Identical titles are common (exact TOC matches) and need no scorer
+        if s1 == s2:
+            return 1.0
+        # A large length mismatch already caps the achievable ratio well
+        # below any useful threshold, so skip the scorer entirely
+        m, n = len(s1), len(s2)
+        if min(m, n) / max(m, n) < 0.4:
+            return 0.0
+        if _fuzz is not None:
+            return _fuzz.ratio(s1, s2) / 100.0
+        return SequenceMatcher(None, s1, s2).ratio()
+
     @staticmethod
     def fuzzy_match(str1: str, str2: str) -> float:
         """Calculate fuzzy match score between two strings."""
@@ -151,20 +286,9 @@ class TOCAnalyzer:
         if not str1 or not str2:
             return 0.0
 
-        # Normalize strings
-        s1 = re.sub(r"[^\w\s]", "", str1.lower())
-        s2 = re.sub(r"[^\w\s]", "", str2.lower())
-
-        # Remove common prefixes
-        s1 = re.sub(r"^\[\]", "", s1).strip()
-        s2 = re.sub(r"^\[\]", "", s2).strip()
-
-        # Edge case: both empty after normalization
-        if not s1 or not s2:
-            return 0.0
-
-        # Calculate similarity
-        return SequenceMatcher(None, s1, s2).ratio()
+        return TOCAnalyzer._score_normalized(
+            TOCAnalyzer._normalize_title(str1), TOCAnalyzer._normalize_title(str2)
+        )
 
     def validate_extraction(self, recipes: List[Recipe], epub_path: str | Path) -> ValidationReport:
         """Validate extraction against TOC."""
@@ -186,22 +310,67 @@ class TOCAnalyzer:
         missing = []
         match_threshold = 0.6  # 60% similarity required
 
-        for toc_recipe in toc_recipes:
-            best_match = None
-            best_score = 0.0
-
-            # Bounds checking: Ensure recipes list is not empty
-            if recipes:
-                for extracted in recipes:
-                    score = self.fuzzy_match(toc_recipe.title, extracted.title)
-                    if score > best_score:
-                        best_score = score
-                        best_match = extracted
-
-            if best_score >= match_threshold and best_match is not None:
-                matches.append((toc_recipe, best_match, best_score))
-            else:
-                missing.append(toc_recipe)
+        # Normalize every title exactly once: re-normalizing inside the
+        # matching loops would redo the regex work len(toc) * len(recipes)
+        # times
+        recipe_norms = [self._normalize_title(r.title) for r in recipes]
+
+        if _process is not None and recipes:
+            # Let rapidfuzz run the inner loop over all recipe titles in C:
+            # extractOne applies the score cutoff while scanning instead of
+            # scoring every pair fully
+            for toc_recipe in toc_recipes:
+                query = toc_recipe.title_norm or self._normalize_title(toc_recipe.title)
+                best = (
+                    _process.extractOne(
+                        query,
+                        recipe_norms,
+                        scorer=_fuzz.ratio,
+                        score_cutoff=match_threshold * 100,
+                    )
+                    if query
+                    else None
+                )
+                if best is not None:
+                    matches.append((toc_recipe, recipes[best[2]], best[1] / 100.0))
+                else:
+                    missing.append(toc_recipe)
+        else:
+            # Bucket recipes by the first character of their normalized
+            # title: a matching title almost always starts with the same
+            # letter, so scanning the bucket first usually finds a
+            # near-perfect score and lets the full scan be skipped
+            buckets: dict = {}
+            for index, norm in enumerate(recipe_norms):
+                if norm:
+                    buckets.setdefault(norm[0], []).append(index)
+
+            for toc_recipe in toc_recipes:
+                query = toc_recipe.title_norm or self._normalize_title(toc_recipe.title)
+                best_match = None
+                best_score = 0.0
+
+                bucket = buckets.get(query[0], ()) if query else ()
+                candidate_orders = (bucket, range(len(recipes)))
+                for candidates in candidate_orders:
+                    for index in candidates:
+                        score = self._score_normalized(query, recipe_norms[index])
+                        if score > best_score:
+                            best_score = score
+                            best_match = recipes[index]
+                            # Effectively exact; the rest of the scan
+                            # cannot do better than tie
+                            if best_score >= 0.99:
+                                break
+                    # Only fall back to the global scan when the bucket
+                    # did not produce an acceptable match
+                    if best_score >= match_threshold:
+                        break
+
+                if best_score >= match_threshold and best_match is not None:
+                    matches.append((toc_recipe, best_match, best_score))
+                else:
+                    missing.append(toc_recipe)
 
         # Bounds checking: Prevent division by zero
         coverage = len(matches) / len(toc_recipes) if toc_recipes else 0.0
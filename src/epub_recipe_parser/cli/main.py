@@ -1,18 +1,33 @@
 """Main CLI entry point."""
 
+import fnmatch
+import hashlib
 import json
+import os
+import pickle
 import sys
 import click
+
+# orjson serializes in C straight to UTF-8 bytes; exports fall back to the
+# stdlib encoder when it is not installed
+try:
+    import orjson
+except ImportError:
+    orjson = None
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from heapq import nlargest
 from pathlib import Path
 from rich.console import Console
 from rich.table import Table
 from rich.progress import Progress, SpinnerColumn, TextColumn, BarColumn, TaskProgressColumn
 from rich.panel import Panel
 
+from epub_recipe_parser.__version__ import __version__ as EXTRACTOR_VERSION
 from epub_recipe_parser.core import EPUBRecipeExtractor, ExtractorConfig
 from epub_recipe_parser.storage import RecipeDatabase
 from epub_recipe_parser.analyzers import TOCAnalyzer, EPUBStructureAnalyzer
 from epub_recipe_parser.exporters import ObsidianVaultExporter
+from epub_recipe_parser.utils.epub_zip import EPUBZipReader
 
 console = Console()
 
@@ -72,7 +87,10 @@ def extract(epub_file: str, output: str, min_quality: int, verbose: bool):
         ) as progress:
             task = progress.add_task(f"Saving {len(recipes)} recipes to database...", total=None)
             db = RecipeDatabase(output)
-            saved = db.save_recipes(recipes)
+            # One transaction for the whole book: one fsync instead of
+            # one per insert
+            with db.transaction():
+                saved = db.save_recipes(recipes)
             progress.update(task, completed=True)
 
         # Success summary
@@ -80,13 +98,8 @@ def extract(epub_file: str, output: str, min_quality: int, verbose: bool):
         console.print(f"[green]✅ Successfully extracted {len(recipes)} recipes[/green]")
         console.print(f"[green]💾 Saved {saved} recipes to {output}[/green]")
 
-        # Show quality distribution
-        quality_scores = [r.quality_score for r in recipes]
-        avg_score = sum(quality_scores) / len(quality_scores)
-        excellent = len([s for s in quality_scores if s >= 70])
-        good = len([s for s in quality_scores if 50 <= s < 70])
-        fair = len([s for s in quality_scores if 30 <= s < 50])
-        poor = len([s for s in quality_scores if s < 30])
+        # Show quality distribution, bucketing every score in one pass
+        avg_score, excellent, good, fair, poor = _quality_buckets(recipes)
 
         console.print()
         console.print(
@@ -104,7 +117,8 @@ def extract(epub_file: str, output: str, min_quality: int, verbose: bool):
         # Show verbose details if requested
         if verbose:
             console.print("\n[bold]Top 5 Recipes:[/bold]")
-            top_recipes = sorted(recipes, key=lambda r: r.quality_score, reverse=True)[:5]
+            # nlargest keeps a 5-element heap instead of sorting a full copy
+            top_recipes = nlargest(5, recipes, key=lambda r: r.quality_score)
             for i, recipe in enumerate(top_recipes, 1):
                 console.print(f"  {i}. {recipe.title} - [cyan]{recipe.quality_score}/100[/cyan]")
 
@@ -123,12 +137,34 @@ def extract(epub_file: str, output: str, min_quality: int, verbose: bool):
 @click.option("--output", "-o", default="recipes.db", help="Output database file")
 @click.option("--min-quality", "-q", default=20, help="Minimum quality score (0-100)")
 @click.option("--pattern", "-p", default="*.epub", help="File pattern to match")
+@click.option(
+    "--workers", "-w", default=0, help="Worker processes (0: one per CPU core)"
+)
+@click.option("--no-cache", is_flag=True, help="Re-extract even if a cached result exists")
 @click.option("--verbose", "-v", is_flag=True, help="Show detailed processing information")
-def batch(directory: str, output: str, min_quality: int, pattern: str, verbose: bool):
+def batch(
+    directory: str,
+    output: str,
+    min_quality: int,
+    pattern: str,
+    workers: int,
+    no_cache: bool,
+    verbose: bool,
+):
     """Batch process multiple EPUB files."""
     try:
         dir_path = Path(directory)
-        epub_files = list(dir_path.glob(pattern))
+        # scandir matches names against the pattern without stat-ing every
+        # entry the way Path.glob does; patterns with path separators still
+        # need glob's directory walking
+        if os.sep in pattern or "**" in pattern:
+            epub_files = list(dir_path.glob(pattern))
+        else:
+            epub_files = [
+                Path(entry.path)
+                for entry in os.scandir(dir_path)
+                if entry.is_file(follow_symlinks=False) and fnmatch.fnmatch(entry.name, pattern)
+            ]
 
         if not epub_files:
             console.print(f"[yellow]⚠️  No EPUB files found in {directory}[/yellow]")
@@ -149,51 +185,74 @@ def batch(directory: str, output: str, min_quality: int, pattern: str, verbose:
         )
         console.print()
 
-        config = ExtractorConfig(min_quality_score=min_quality)
-        extractor = EPUBRecipeExtractor(config=config)
         db = RecipeDatabase(output)
 
-        all_recipes = []
+        # Running counters instead of retaining every Recipe: peak memory
+        # stays at one book's recipes, not the whole library's
+        total_recipes = 0
+        total_score = 0
+        excellent = 0
         failed_files = []
 
-        # Process files with progress bar
-        with Progress(
+        # Each file is independent, so extraction fans out across worker
+        # processes; all database writes stay on this process to avoid
+        # SQLite write contention
+        max_workers = min(workers or os.cpu_count() or 1, len(epub_files))
+
+        # Process files with progress bar; the whole run's saves share one
+        # transaction so SQLite fsyncs once instead of once per EPUB
+        with db.transaction(), Progress(
             SpinnerColumn(),
             TextColumn("[progress.description]{task.description}"),
             BarColumn(),
             TaskProgressColumn(),
             console=console,
+            # Rendering has real per-refresh cost over thousands of small
+            # files; cap it, and skip it entirely when output is piped
+            refresh_per_second=10,
+            disable=not console.is_terminal,
         ) as progress:
             task = progress.add_task(
                 f"Processing {len(epub_files)} files...", total=len(epub_files)
             )
 
-            for epub_file in epub_files:
-                try:
-                    progress.update(task, description=f"Processing {epub_file.name}...")
-
-                    recipes = extractor.extract_from_epub(str(epub_file))
-                    all_recipes.extend(recipes)
-                    db.save_recipes(recipes)
-
-                    if verbose:
-                        console.print(
-                            f"  [green]✓[/green] {epub_file.name}: {len(recipes)} recipes"
-                        )
-
-                except Exception as e:
-                    failed_files.append((epub_file.name, str(e)))
-                    if verbose:
-                        console.print(f"  [red]✗[/red] {epub_file.name}: {str(e)}")
-
-                progress.advance(task)
+            with ProcessPoolExecutor(
+                max_workers=max_workers, initializer=_init_worker, initargs=(min_quality,)
+            ) as executor:
+                futures = {
+                    executor.submit(
+                        _extract_one, str(epub_file), min_quality, not no_cache
+                    ): epub_file
+                    for epub_file in epub_files
+                }
+                for future in as_completed(futures):
+                    name = futures[future].name
+                    epub_path, recipes, error = future.result()
+
+                    if error is None:
+                        total_recipes += len(recipes)
+                        for recipe in recipes:
+                            score = recipe.quality_score
+                            total_score += score
+                            excellent += score >= 70
+                        db.save_recipes(recipes)
+                        if verbose:
+                            console.print(f"  [green]✓[/green] {name}: {len(recipes)} recipes")
+                    else:
+                        failed_files.append((name, error))
+                        if verbose:
+                            console.print(f"  [red]✗[/red] {name}: {error}")
+
+                    # One update call per file: description and advance
+                    # together halve the task-state churn
+                    progress.update(task, advance=1, description=f"Processed {name}")
 
         # Summary
         console.print()
         console.print(
             f"[green]✅ Successfully processed {len(epub_files) - len(failed_files)}/{len(epub_files)} files[/green]"
         )
-        console.print(f"[green]💾 Total recipes extracted: {len(all_recipes)}[/green]")
+        console.print(f"[green]💾 Total recipes extracted: {total_recipes}[/green]")
         console.print(f"[green]📁 Saved to {output}[/green]")
 
         if failed_files:
@@ -203,18 +262,16 @@ def batch(directory: str, output: str, min_quality: int, pattern: str, verbose:
             if len(failed_files) > 5:
                 console.print(f"  [dim]... and {len(failed_files) - 5} more[/dim]")
 
-        # Show quality statistics
-        if all_recipes:
-            quality_scores = [r.quality_score for r in all_recipes]
-            avg_score = sum(quality_scores) / len(quality_scores)
-            excellent = len([s for s in quality_scores if s >= 70])
+        # Show quality statistics from the running counters
+        if total_recipes:
+            avg_score = total_score / total_recipes
 
             console.print()
             console.print(
                 Panel.fit(
                     f"[bold]Quality Summary[/bold]\n\n"
                     f"Average Score: [cyan]{avg_score:.1f}/100[/cyan]\n"
-                    f"Excellent (70+): [green]{excellent}[/green] ({excellent*100/len(all_recipes):.1f}%)",
+                    f"Excellent (70+): [green]{excellent}[/green] ({excellent*100/total_recipes:.1f}%)",
                     border_style="green",
                 )
             )
@@ -285,12 +342,23 @@ def validate(epub_file: str, database: str):
     # Get extracted recipes from database
     db = RecipeDatabase(database)
 
-    # Query all recipes (we'll filter by book if needed)
-    all_recipes = db.query()
+    # Narrow to this book's rows in SQL: recipes store the EPUB's DC
+    # title, so matching against other books' recipes is wasted fuzzy
+    # scoring. Fall back to the full table when the filter finds nothing
+    # (older databases or mismatched metadata).
+    try:
+        with EPUBZipReader(epub_file) as reader:
+            book_title = reader.metadata("title")
+    except Exception:
+        book_title = None
+
+    recipes = db.query(filters={"book": book_title}) if book_title else []
+    if not recipes:
+        recipes = db.query()
 
     # Validate
     toc_analyzer = TOCAnalyzer()
-    report = toc_analyzer.validate_extraction(all_recipes, epub_file)
+    report = toc_analyzer.validate_extraction(recipes, epub_file)
 
     console.print("[bold]📊 Validation Results:[/bold]")
     console.print(f"  TOC entries: {report.toc_count}")
@@ -317,7 +385,10 @@ def search(database: str, query: str, limit: int, tags: tuple):
 
     # Convert tags tuple to list if provided
     tag_list = list(tags) if tags else None
-    recipes = db.search(query, limit=limit, tags=tag_list)
+    # Only fetch what the table renders; the big text columns stay in SQLite
+    recipes = db.search(
+        query, limit=limit, tags=tag_list, columns=["title", "book", "quality_score"]
+    )
 
     if not recipes:
         if tag_list:
@@ -362,7 +433,12 @@ def query_tags(database: str, tags: tuple, limit: int, match_all: bool):
     db = RecipeDatabase(database)
 
     tag_list = list(tags)
-    recipes = db.query(tags=tag_list, tags_match_all=match_all, limit=limit)
+    recipes = db.query(
+        tags=tag_list,
+        tags_match_all=match_all,
+        limit=limit,
+        columns=["title", "book", "quality_score"],
+    )
 
     if not recipes:
         match_type = "all" if match_all else "any"
@@ -455,20 +531,23 @@ def export(
     try:
         db = RecipeDatabase(database)
 
-        # Query recipes with progress indicator
-        with Progress(
-            SpinnerColumn(),
-            TextColumn("[progress.description]{task.description}"),
-            console=console,
-        ) as progress:
-            task = progress.add_task("Loading recipes from database...", total=None)
-            if min_quality is not None:
+        # JSON and markdown stream recipes straight from the cursor, so
+        # only a cheap COUNT runs up front; the vault exporter needs the
+        # full list for duplicate-name resolution
+        total = db.count(min_quality=min_quality)
+
+        recipes: list = []
+        if format == "vault" and total:
+            with Progress(
+                SpinnerColumn(),
+                TextColumn("[progress.description]{task.description}"),
+                console=console,
+            ) as progress:
+                task = progress.add_task("Loading recipes from database...", total=None)
                 recipes = db.query(min_quality=min_quality)
-            else:
-                recipes = db.query()
-            progress.update(task, completed=True)
+                progress.update(task, completed=True)
 
-        if not recipes:
+        if not total:
             console.print("[yellow]⚠️  No recipes found to export![/yellow]")
             if min_quality is not None:
                 console.print(f"[dim]Try lowering --min-quality (current: {min_quality})[/dim]")
@@ -490,7 +569,7 @@ def export(
                 Panel.fit(
                     f"[bold cyan]Exporting Recipes[/bold cyan]\n"
                     f"Format: Obsidian Vault\n"
-                    f"Recipes: {len(recipes)}\n"
+                    f"Recipes: {total}\n"
                     f"Organization: By {organize_by}\n"
                     f"Output: {output_path.name}/",
                     border_style="cyan",
@@ -501,7 +580,7 @@ def export(
                 Panel.fit(
                     f"[bold cyan]Exporting Recipes[/bold cyan]\n"
                     f"Format: {format.upper()}\n"
-                    f"Recipes: {len(recipes)}\n"
+                    f"Recipes: {total}\n"
                     f"Output: {output_path.name}",
                     border_style="cyan",
                 )
@@ -517,9 +596,11 @@ def export(
             task = progress.add_task(f"Exporting to {format.upper()}...", total=None)
 
             if format == "json":
-                _export_json(recipes, output_path)
+                _export_json(db.iter_recipes(min_quality=min_quality), output_path, count=total)
             elif format == "markdown":
-                _export_markdown(recipes, output_path)
+                _export_markdown(
+                    db.iter_recipes(min_quality=min_quality), output_path, count=total
+                )
             elif format == "vault":
                 exporter = ObsidianVaultExporter()
                 stats = exporter.export_vault(recipes, output_path, organize_by=organize_by)
@@ -556,14 +637,13 @@ def export(
             file_size = output_path.stat().st_size
             size_mb = file_size / (1024 * 1024)
 
-            console.print(f"[green]✅ Successfully exported {len(recipes)} recipes[/green]")
+            console.print(f"[green]✅ Successfully exported {total} recipes[/green]")
             console.print(f"[green]📄 Output: {output}[/green]")
             console.print(f"[green]💾 Size: {size_mb:.2f} MB[/green]")
 
             if verbose:
                 console.print("\n[bold]Export Details:[/bold]")
-                quality_scores = [r.quality_score for r in recipes]
-                avg_score = sum(quality_scores) / len(quality_scores)
+                avg_score = _average_quality(db, min_quality)
                 console.print(f"  Average quality: {avg_score:.1f}/100")
                 console.print(f"  Format: {format}")
                 console.print(f"  Path: {output_path.absolute()}")
@@ -710,33 +790,188 @@ def ab_report(database: str):
         sys.exit(1)
 
 
-def _export_json(recipes: list, output_path: Path) -> None:
-    """Export recipes to JSON format."""
-    data = {
-        "metadata": {"count": len(recipes), "format_version": "1.0"},
-        "recipes": [recipe.to_dict() for recipe in recipes],
-    }
+def _quality_buckets(recipes: list) -> tuple:
+    """Average score and quality buckets, tallied in one pass.
+
+    Returns (avg_score, excellent, good, fair, poor); the filtered
+    comprehensions this replaces walked the scores five times.
+    """
+    total = excellent = good = fair = poor = 0
+    for recipe in recipes:
+        score = recipe.quality_score
+        total += score
+        if score >= 70:
+            excellent += 1
+        elif score >= 50:
+            good += 1
+        elif score >= 30:
+            fair += 1
+        else:
+            poor += 1
+    return total / len(recipes), excellent, good, fair, poor
 
-    with open(output_path, "w", encoding="utf-8") as f:
-        json.dump(data, f, indent=2, ensure_ascii=False)
 
+# Extraction results cached by EPUB content hash: rerunning batch over a
+# directory where most files are unchanged skips parsing them entirely
+_CACHE_DIR = Path(os.environ.get("XDG_CACHE_HOME", Path.home() / ".cache")) / "epub-recipe-parser"
 
-def _export_markdown(recipes: list, output_path: Path) -> None:
-    """Export recipes to Markdown format."""
-    with open(output_path, "w", encoding="utf-8") as f:
-        f.write("# Recipe Collection\n\n")
-        f.write(f"Total Recipes: {len(recipes)}\n\n")
-        f.write("---\n\n")
+
+def _content_digest(epub_file: str) -> str:
+    """SHA-256 of the file's bytes, streamed without loading it whole."""
+    with open(epub_file, "rb") as f:
+        # file_digest hashes in C without the data ever surfacing as
+        # Python bytes; it arrived in 3.11, so 3.10 chunks by hand
+        if hasattr(hashlib, "file_digest"):
+            return hashlib.file_digest(f, "sha256").hexdigest()
+        digest = hashlib.sha256()
+        while chunk := f.read(1 << 20):
+            digest.update(chunk)
+        return digest.hexdigest()
+
+
+def _cache_lookup(cache_path: Path) -> list | None:
+    """Return the cached recipe list, or None on miss or unreadable entry.
+
+    Any failure means re-extraction: entries written before a Recipe
+    schema change can raise TypeError/AttributeError during unpickling,
+    and a stale cache must never be worse than no cache.
+    """
+    try:
+        with open(cache_path, "rb") as f:
+            return pickle.load(f)
+    except Exception:
+        return None
+
+
+def _cache_store(cache_path: Path, recipes: list) -> None:
+    """Write the recipe list to the cache; failures are non-fatal."""
+    try:
+        cache_path.parent.mkdir(parents=True, exist_ok=True)
+        with open(cache_path, "wb") as f:
+            pickle.dump(recipes, f, protocol=pickle.HIGHEST_PROTOCOL)
+    except OSError:
+        pass
+
+
+# One extractor per worker process, built by the pool initializer so its
+# analyzers and compiled patterns are reused for every file the worker
+# handles instead of being rebuilt per task
+_EXTRACTOR = None
+
+
+def _init_worker(min_quality: int) -> None:
+    """Build the per-process extractor when a batch pool worker starts."""
+    global _EXTRACTOR
+    _EXTRACTOR = EPUBRecipeExtractor(config=ExtractorConfig(min_quality_score=min_quality))
+
+
+def _extract_one(epub_file: str, min_quality: int, use_cache: bool = False) -> tuple:
+    """Extract recipes from one EPUB inside a batch worker process.
+
+    Returns (path, recipes, error) with the error as a string so only
+    plain picklable values cross the process boundary. With use_cache,
+    results are keyed by the file's content hash, the quality threshold,
+    and the extractor version (as in the benchmark cache), so unchanged
+    files on a rerun cost one hash pass and a package upgrade never
+    serves recipes extracted by old logic.
+    """
+    try:
+        cache_path = None
+        if use_cache:
+            try:
+                digest = _content_digest(epub_file)
+                cache_path = _CACHE_DIR / f"{digest}-q{min_quality}-v{EXTRACTOR_VERSION}.pkl"
+            except OSError:
+                cache_path = None
+            else:
+                cached = _cache_lookup(cache_path)
+                if cached is not None:
+                    return epub_file, cached, None
+
+        extractor = _EXTRACTOR
+        if extractor is None:
+            extractor = EPUBRecipeExtractor(config=ExtractorConfig(min_quality_score=min_quality))
+        recipes = extractor.extract_from_epub(epub_file)
+
+        if cache_path is not None:
+            _cache_store(cache_path, recipes)
+        return epub_file, recipes, None
+    except Exception as e:
+        return epub_file, [], str(e)
+
+
+def _average_quality(db: RecipeDatabase, min_quality: int | None) -> float:
+    """Average quality score straight from SQL, without loading recipes."""
+    query_sql = "SELECT AVG(quality_score) FROM recipes"
+    params: list = []
+    if min_quality is not None:
+        query_sql += " WHERE quality_score >= ?"
+        params.append(min_quality)
+    with db._get_connection() as conn:
+        row = conn.execute(query_sql, params).fetchone()
+    return row[0] or 0.0
+
+
+def _export_json(recipes, output_path: Path, count: int | None = None) -> None:
+    """Export recipes to JSON format.
+
+    The envelope is written by hand and recipes are serialized one at a
+    time, so peak memory holds a single recipe dict instead of the whole
+    collection twice (dict tree plus serialized text). Output is compact;
+    pretty-printing would roughly double both the file and the work.
+
+    ``recipes`` may be any iterable; pass ``count`` when it is not a list
+    (e.g. a database cursor) so the envelope's count need not consume it.
+    """
+    if count is None:
+        recipes = list(recipes)
+        count = len(recipes)
+    header = '{"metadata": {"count": %d, "format_version": "1.0"}, "recipes": [' % count
+
+    if orjson is not None:
+        # Bytes go straight to the file with no intermediate Python str
+        with open(output_path, "wb") as f:
+            f.write(header.encode())
+            for i, recipe in enumerate(recipes):
+                if i:
+                    f.write(b",")
+                f.write(orjson.dumps(recipe.to_dict()))
+            f.write(b"]}")
+    else:
+        with open(output_path, "w", encoding="utf-8") as f:
+            f.write(header)
+            for i, recipe in enumerate(recipes):
+                if i:
+                    f.write(",")
+                json.dump(recipe.to_dict(), f, ensure_ascii=False)
+            f.write("]}")
+
+
+def _export_markdown(recipes, output_path: Path, count: int | None = None) -> None:
+    """Export recipes to Markdown format.
+
+    Each recipe's fragments are joined into one string before writing,
+    so the file sees one write per recipe instead of a dozen small ones;
+    the large buffer batches those into megabyte-sized syscalls.
+
+    ``recipes`` may be any iterable; pass ``count`` when it is not a list
+    so the header's total need not consume it.
+    """
+    if count is None:
+        recipes = list(recipes)
+        count = len(recipes)
+    with open(output_path, "w", encoding="utf-8", buffering=1024 * 1024) as f:
+        f.write(f"# Recipe Collection\n\nTotal Recipes: {count}\n\n---\n\n")
 
         for i, recipe in enumerate(recipes, 1):
-            f.write(f"## {i}. {recipe.title}\n\n")
+            parts = [f"## {i}. {recipe.title}\n\n"]
 
             if recipe.author:
-                f.write(f"**Author:** {recipe.author}\n\n")
+                parts.append(f"**Author:** {recipe.author}\n\n")
             if recipe.book:
-                f.write(f"**Book:** {recipe.book}\n\n")
+                parts.append(f"**Book:** {recipe.book}\n\n")
             if recipe.chapter:
-                f.write(f"**Chapter:** {recipe.chapter}\n\n")
+                parts.append(f"**Chapter:** {recipe.chapter}\n\n")
 
             # Metadata
             metadata_parts = []
@@ -748,30 +983,25 @@ def _export_markdown(recipes: list, output_path: Path) -> None:
                 metadata_parts.append(f"Cook Time: {recipe.cook_time}")
 
             if metadata_parts:
-                f.write(f"**{' | '.join(metadata_parts)}**\n\n")
+                parts.append(f"**{' | '.join(metadata_parts)}**\n\n")
 
             # Quality score
-            f.write(f"*Quality Score: {recipe.quality_score}/100*\n\n")
+            parts.append(f"*Quality Score: {recipe.quality_score}/100*\n\n")
 
             # Ingredients
             if recipe.ingredients:
-                f.write("### Ingredients\n\n")
-                f.write(recipe.ingredients)
-                f.write("\n\n")
+                parts.append(f"### Ingredients\n\n{recipe.ingredients}\n\n")
 
             # Instructions
             if recipe.instructions:
-                f.write("### Instructions\n\n")
-                f.write(recipe.instructions)
-                f.write("\n\n")
+                parts.append(f"### Instructions\n\n{recipe.instructions}\n\n")
 
             # Notes
             if recipe.notes:
-                f.write("### Notes\n\n")
-                f.write(recipe.notes)
-                f.write("\n\n")
+                parts.append(f"### Notes\n\n{recipe.notes}\n\n")
 
-            f.write("---\n\n")
+            parts.append("---\n\n")
+            f.write("".join(parts))
 
 
 if __name__ == "__main__":
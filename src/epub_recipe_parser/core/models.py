@@ -19,9 +19,14 @@ class LogLevel(Enum):
     DEBUG = "DEBUG"
 
 
-@dataclass
+@dataclass(slots=True)
 class Recipe:
-    """Recipe data model."""
+    """Recipe data model.
+
+    slots=True keeps instances compact: no per-instance __dict__ means less
+    memory per recipe and a smaller pickle payload when recipe lists cross
+    the process boundary during parallel batch extraction.
+    """
 
     title: str
     book: str
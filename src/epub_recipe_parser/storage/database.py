@@ -23,6 +23,9 @@ class RecipeDatabase:
             db_path: Path to SQLite database file
         """
         self.db_path = Path(db_path)
+        # Connection held open across save_recipes(defer_commit=True) calls so
+        # many saves share one transaction; created lazily, closed by commit()
+        self._deferred_conn: Optional[sqlite3.Connection] = None
         self.init_database()
 
     @contextmanager
@@ -37,6 +40,7 @@ class RecipeDatabase:
         conn = None
         try:
             conn = sqlite3.connect(self.db_path)
+            self._configure_connection(conn)
             yield conn
         except sqlite3.Error as e:
             if conn:
@@ -46,6 +50,29 @@ class RecipeDatabase:
             if conn:
                 conn.close()
 
+    def _configure_connection(self, conn: sqlite3.Connection) -> None:
+        """Apply write-oriented PRAGMAs to a fresh connection.
+
+        The default journal mode (DELETE) fsyncs a rollback journal on every
+        commit and synchronous=FULL doubles the fsyncs, which makes the
+        database the bottleneck during batch extraction. WAL journaling with
+        synchronous=NORMAL keeps commits durable-enough (a crash can lose the
+        last transaction but never corrupts the file) while writers no longer
+        block readers. temp_store/cache_size/mmap_size keep sorts and reads
+        off disk. WAL is skipped for in-memory databases, where it does not
+        apply.
+        """
+        if str(self.db_path) != ":memory:":
+            conn.execute("PRAGMA journal_mode=WAL")
+        conn.executescript(
+            """
+            PRAGMA synchronous=NORMAL;
+            PRAGMA temp_store=MEMORY;
+            PRAGMA cache_size=-65536;
+            PRAGMA mmap_size=268435456;
+            """
+        )
+
     def init_database(self):
         """Initialize SQLite database schema in a thread-safe manner.
 
@@ -206,11 +233,18 @@ class RecipeDatabase:
             cursor.execute("ALTER TABLE recipes ADD COLUMN metadata TEXT")
             self._set_schema_version(cursor, 2, "Added metadata column for JSON data")
 
-    def save_recipes(self, recipes: List[Recipe]) -> int:
+    def save_recipes(self, recipes: List[Recipe], defer_commit: bool = False) -> int:
         """Save recipes to database with proper error handling and tag support.
 
         Args:
             recipes: List of Recipe objects to save
+            defer_commit: If True, insert inside a shared long-lived transaction
+                instead of committing per call. Batch callers saving once per
+                EPUB pay one fsync per file otherwise; grouping many saves into
+                one transaction and calling commit() at the end is dramatically
+                faster. The caller must call commit() when done. Calls made
+                inside a transaction() block join that transaction
+                automatically.
 
         Returns:
             Number of recipes successfully saved
@@ -221,62 +255,180 @@ class RecipeDatabase:
         if not recipes:
             return 0
 
-        saved = 0
+        if defer_commit or self._deferred_conn is not None:
+            conn = self._begin_deferred()
+            return self._insert_recipes(conn.cursor(), recipes)
+
         with self._get_connection() as conn:
-            cursor = conn.cursor()
+            saved = self._insert_recipes(conn.cursor(), recipes)
+            conn.commit()
 
-            for recipe in recipes:
-                try:
-                    # Serialize metadata to JSON
-                    metadata_json = json.dumps(recipe.metadata) if recipe.metadata else None
+        return saved
 
-                    # Insert recipe
-                    cursor.execute(
-                        """
-                        INSERT INTO recipes (
-                            title, book, author, chapter, epub_section,
-                            serves, prep_time, cook_time,
-                            ingredients, instructions, notes,
-                            cooking_method, protein_type,
-                            quality_score, raw_content, metadata
-                        ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-                    """,
-                        (
-                            recipe.title,
-                            recipe.book,
-                            recipe.author,
-                            recipe.chapter,
-                            recipe.epub_section,
-                            recipe.serves,
-                            recipe.prep_time,
-                            recipe.cook_time,
-                            recipe.ingredients,
-                            recipe.instructions,
-                            recipe.notes,
-                            recipe.cooking_method,
-                            recipe.protein_type,
-                            recipe.quality_score,
-                            recipe.raw_content,
-                            metadata_json,
-                        ),
-                    )
+    def _begin_deferred(self) -> sqlite3.Connection:
+        """Lazily open the shared write connection inside one transaction."""
+        if self._deferred_conn is None:
+            self._deferred_conn = sqlite3.connect(self.db_path)
+            self._configure_connection(self._deferred_conn)
+            # Take the write lock up front so the transaction cannot
+            # deadlock on lock promotion mid-batch
+            self._deferred_conn.execute("BEGIN IMMEDIATE")
+        return self._deferred_conn
 
-                    recipe_id = cursor.lastrowid
+    @contextmanager
+    def transaction(self):
+        """Group every save inside the block into a single transaction.
 
-                    # Save tags if present
-                    if recipe.tags:
-                        self._save_recipe_tags(cursor, recipe_id, recipe.tags)
+        save_recipes calls issued within the block share one BEGIN
+        IMMEDIATE transaction, so a whole batch run pays a single fsync.
+        Commits when the block exits; rolls back if it raises.
+        """
+        conn = self._begin_deferred()
+        try:
+            yield self
+        except Exception:
+            conn.rollback()
+            conn.close()
+            self._deferred_conn = None
+            raise
+        self.commit()
+
+    def commit(self) -> None:
+        """Commit and close any transaction opened by save_recipes(defer_commit=True).
+
+        Safe to call when no deferred transaction is open.
+        """
+        if self._deferred_conn is not None:
+            self._deferred_conn.commit()
+            self._deferred_conn.close()
+            self._deferred_conn = None
+
+    _RECIPE_INSERT_SQL = """
+        INSERT INTO recipes (
+            title, book, author, chapter, epub_section,
+            serves, prep_time, cook_time,
+            ingredients, instructions, notes,
+            cooking_method, protein_type,
+            quality_score, raw_content, metadata
+        ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+    """
+
+    @staticmethod
+    def _recipe_row(recipe: Recipe) -> tuple:
+        """Build the parameter tuple for one recipe insert."""
+        return (
+            recipe.title,
+            recipe.book,
+            recipe.author,
+            recipe.chapter,
+            recipe.epub_section,
+            recipe.serves,
+            recipe.prep_time,
+            recipe.cook_time,
+            recipe.ingredients,
+            recipe.instructions,
+            recipe.notes,
+            recipe.cooking_method,
+            recipe.protein_type,
+            recipe.quality_score,
+            recipe.raw_content,
+            json.dumps(recipe.metadata) if recipe.metadata else None,
+        )
 
-                    saved += 1
-                except sqlite3.IntegrityError as e:
-                    print(f"Duplicate or constraint violation for recipe '{recipe.title}': {e}")
-                except sqlite3.Error as e:
-                    print(f"Error saving recipe '{recipe.title}': {e}")
+    def _insert_recipes(self, cursor: sqlite3.Cursor, recipes: List[Recipe]) -> int:
+        """Insert recipes (and their tags) using the given cursor.
 
-            conn.commit()
+        Commit/rollback is the caller's responsibility. The fast path
+        inserts every row with one executemany (the statement is prepared
+        once, not reparsed per row) and writes tags in a bulk second pass;
+        if any row fails, the savepoint is rolled back and the per-row
+        path re-runs the batch to report which recipes were rejected.
+
+        Args:
+            cursor: Database cursor
+            recipes: List of Recipe objects to insert
+
+        Returns:
+            Number of recipes successfully inserted
+        """
+        cursor.execute("SAVEPOINT bulk_insert")
+        try:
+            cursor.executemany(self._RECIPE_INSERT_SQL, map(self._recipe_row, recipes))
+        except sqlite3.Error:
+            cursor.execute("ROLLBACK TO bulk_insert")
+            cursor.execute("RELEASE bulk_insert")
+            return self._insert_recipes_one_by_one(cursor, recipes)
+        cursor.execute("RELEASE bulk_insert")
+
+        # The enclosing transaction holds the write lock, so the batch got
+        # consecutive rowids ending at the connection's last insert rowid.
+        # Read it with a query: cursor.lastrowid is documented as undefined
+        # after executemany
+        last_id = cursor.execute("SELECT last_insert_rowid()").fetchone()[0]
+        first_id = last_id - len(recipes) + 1
+        tagged = [
+            (first_id + index, recipe.tags)
+            for index, recipe in enumerate(recipes)
+            if recipe.tags
+        ]
+        if tagged:
+            self._save_tags_bulk(cursor, tagged)
+
+        return len(recipes)
+
+    def _insert_recipes_one_by_one(self, cursor: sqlite3.Cursor, recipes: List[Recipe]) -> int:
+        """Per-row insert fallback that reports each rejected recipe."""
+        saved = 0
+        for recipe in recipes:
+            try:
+                cursor.execute(self._RECIPE_INSERT_SQL, self._recipe_row(recipe))
+
+                recipe_id = cursor.lastrowid
+
+                # Save tags if present
+                if recipe.tags:
+                    self._save_recipe_tags(cursor, recipe_id, recipe.tags)
+
+                saved += 1
+            except sqlite3.IntegrityError as e:
+                print(f"Duplicate or constraint violation for recipe '{recipe.title}': {e}")
+            except sqlite3.Error as e:
+                print(f"Error saving recipe '{recipe.title}': {e}")
 
         return saved
 
+    def _save_tags_bulk(self, cursor: sqlite3.Cursor, tagged: List[tuple]) -> None:
+        """Save tags for many recipes in three statements.
+
+        Args:
+            cursor: Database cursor
+            tagged: List of (recipe_id, tags) pairs
+        """
+        pairs = []
+        names = set()
+        for recipe_id, tags in tagged:
+            for tag_name in tags:
+                if not tag_name or not tag_name.strip():
+                    continue
+                tag_name = tag_name.strip().lower()
+                names.add(tag_name)
+                pairs.append((recipe_id, tag_name))
+        if not pairs:
+            return
+
+        # tags.tag_name is COLLATE NOCASE, so the IN lookup matches the
+        # case-insensitive behaviour of the per-row path
+        cursor.executemany("INSERT OR IGNORE INTO tags (tag_name) VALUES (?)", [(n,) for n in names])
+        placeholders = ",".join("?" * len(names))
+        cursor.execute(
+            f"SELECT tag_name, id FROM tags WHERE tag_name IN ({placeholders})", list(names)
+        )
+        tag_ids = {name.lower(): tag_id for name, tag_id in cursor.fetchall()}
+        cursor.executemany(
+            "INSERT OR IGNORE INTO recipe_tags (recipe_id, tag_id) VALUES (?, ?)",
+            [(recipe_id, tag_ids[name]) for recipe_id, name in pairs],
+        )
+
     def _save_recipe_tags(self, cursor: sqlite3.Cursor, recipe_id: int, tags: List[str]) -> None:
         """Save tags for a recipe.
 
@@ -350,35 +502,81 @@ class RecipeDatabase:
             cursor: Database cursor for fetching related data
 
         Returns:
-            Recipe object populated from row data
+            Recipe object populated from row data; columns absent from a
+            projected row fall back to the Recipe defaults
         """
+        present = set(row.keys())
+
+        def col(name: str) -> Any:
+            return row[name] if name in present else None
+
         # Get tags for this recipe
         recipe_tags = self._get_recipe_tags(cursor, row["id"])
 
         # Deserialize metadata from JSON
-        metadata_json = row["metadata"]
+        metadata_json = col("metadata")
         recipe_metadata = json.loads(metadata_json) if metadata_json else {}
 
         return Recipe(
-            title=row["title"],
-            book=row["book"],
-            author=row["author"],
-            chapter=row["chapter"],
-            epub_section=row["epub_section"],
-            ingredients=row["ingredients"],
-            instructions=row["instructions"],
-            serves=row["serves"],
-            prep_time=row["prep_time"],
-            cook_time=row["cook_time"],
-            notes=row["notes"],
+            title=col("title"),
+            book=col("book"),
+            author=col("author"),
+            chapter=col("chapter"),
+            epub_section=col("epub_section"),
+            ingredients=col("ingredients"),
+            instructions=col("instructions"),
+            serves=col("serves"),
+            prep_time=col("prep_time"),
+            cook_time=col("cook_time"),
+            notes=col("notes"),
             tags=recipe_tags,
-            cooking_method=row["cooking_method"],
-            protein_type=row["protein_type"],
-            quality_score=row["quality_score"],
-            raw_content=row["raw_content"],
+            cooking_method=col("cooking_method"),
+            protein_type=col("protein_type"),
+            quality_score=col("quality_score") or 0,
+            raw_content=col("raw_content"),
             metadata=recipe_metadata,
         )
 
+    # Columns that may be requested via the columns= projection
+    _PROJECTABLE_COLUMNS = frozenset(
+        {
+            "title",
+            "book",
+            "author",
+            "chapter",
+            "epub_section",
+            "serves",
+            "prep_time",
+            "cook_time",
+            "ingredients",
+            "instructions",
+            "notes",
+            "cooking_method",
+            "protein_type",
+            "difficulty",
+            "quality_score",
+            "raw_content",
+            "metadata",
+        }
+    )
+
+    def _projection(self, columns: Optional[List[str]], prefix: str = "") -> str:
+        """Build a SELECT column list, defaulting to every column.
+
+        id is always included since tag lookup needs it. Requesting only
+        the columns a caller renders keeps the large text columns
+        (ingredients, instructions, raw_content) out of the rows entirely.
+
+        Raises:
+            ValueError: If an invalid column name is requested
+        """
+        if not columns:
+            return f"{prefix}*"
+        invalid = set(columns) - self._PROJECTABLE_COLUMNS
+        if invalid:
+            raise ValueError(f"Invalid column names: {', '.join(sorted(invalid))}")
+        return ", ".join(f"{prefix}{name}" for name in dict.fromkeys(["id", *columns]))
+
     def query(
         self,
         filters: Optional[Dict[str, Any]] = None,
@@ -386,6 +584,7 @@ class RecipeDatabase:
         limit: Optional[int] = None,
         tags: Optional[List[str]] = None,
         tags_match_all: bool = True,
+        columns: Optional[List[str]] = None,
     ) -> List[Recipe]:
         """Query recipes with filters using safe parameterized queries.
 
@@ -396,6 +595,9 @@ class RecipeDatabase:
             tags: List of tags to filter by (case-insensitive)
             tags_match_all: If True, match recipes with ALL tags (AND logic).
                            If False, match recipes with ANY tags (OR logic).
+            columns: Columns to fetch; None fetches everything. Projected
+                queries skip reading the large text columns, and the unread
+                Recipe fields come back as None.
 
         Returns:
             List of matching recipes with their tags populated
@@ -422,13 +624,13 @@ class RecipeDatabase:
 
         # Base query - use DISTINCT when filtering by tags
         if tags:
-            query_sql = "SELECT DISTINCT r.* FROM recipes r"
+            query_sql = f"SELECT DISTINCT {self._projection(columns, 'r.')} FROM recipes r"
             # Join with recipe_tags and tags for tag filtering
             query_sql += " JOIN recipe_tags rt ON r.id = rt.recipe_id"
             query_sql += " JOIN tags t ON rt.tag_id = t.id"
             query_sql += " WHERE 1=1"
         else:
-            query_sql = "SELECT * FROM recipes WHERE 1=1"
+            query_sql = f"SELECT {self._projection(columns)} FROM recipes WHERE 1=1"
 
         params: List[Any] = []
 
@@ -490,13 +692,20 @@ class RecipeDatabase:
 
         return recipes
 
-    def search(self, query: str, limit: int = 50, tags: Optional[List[str]] = None) -> List[Recipe]:
+    def search(
+        self,
+        query: str,
+        limit: int = 50,
+        tags: Optional[List[str]] = None,
+        columns: Optional[List[str]] = None,
+    ) -> List[Recipe]:
         """Search recipes by text query with proper resource management.
 
         Args:
             query: Search query string
             limit: Maximum number of results (default: 50)
             tags: Optional list of tags to filter by (case-insensitive)
+            columns: Columns to fetch; None fetches everything
 
         Returns:
             List of matching recipes ordered by quality score with tags populated
@@ -515,7 +724,7 @@ class RecipeDatabase:
                 placeholders = ", ".join(["?"] * len(tags))
                 cursor.execute(
                     f"""
-                    SELECT DISTINCT r.*
+                    SELECT DISTINCT {self._projection(columns, 'r.')}
                     FROM recipes r
                     JOIN recipe_tags rt ON r.id = rt.recipe_id
                     JOIN tags t ON rt.tag_id = t.id
@@ -535,8 +744,8 @@ class RecipeDatabase:
             else:
                 # Search without tag filtering
                 cursor.execute(
-                    """
-                    SELECT * FROM recipes
+                    f"""
+                    SELECT {self._projection(columns)} FROM recipes
                     WHERE title LIKE ? OR ingredients LIKE ? OR instructions LIKE ?
                     ORDER BY quality_score DESC
                     LIMIT ?
@@ -553,11 +762,49 @@ class RecipeDatabase:
 
         return recipes
 
-    def count(self, filters: Optional[Dict[str, Any]] = None) -> int:
+    def iter_recipes(
+        self,
+        min_quality: Optional[int] = None,
+        batch_size: int = 1000,
+    ):
+        """Yield recipes one at a time, fetching rows in batches.
+
+        Streaming counterpart to query() for consumers like the exporters
+        that touch each recipe once: peak memory holds batch_size rows
+        instead of the whole table. Tags are resolved on a second cursor
+        so the row iteration is not disturbed.
+
+        Args:
+            min_quality: Minimum quality score filter
+            batch_size: Rows fetched from SQLite per round trip
+
+        Yields:
+            Recipe objects in descending quality order
+        """
+        query_sql = "SELECT * FROM recipes"
+        params: List[Any] = []
+        if min_quality is not None:
+            query_sql += " WHERE quality_score >= ?"
+            params.append(min_quality)
+        query_sql += " ORDER BY quality_score DESC"
+
+        with self._get_connection() as conn:
+            conn.row_factory = sqlite3.Row
+            cursor = conn.cursor()
+            tag_cursor = conn.cursor()
+            cursor.execute(query_sql, params)
+            while rows := cursor.fetchmany(batch_size):
+                for row in rows:
+                    yield self._row_to_recipe(row, tag_cursor)
+
+    def count(
+        self, filters: Optional[Dict[str, Any]] = None, min_quality: Optional[int] = None
+    ) -> int:
         """Count recipes matching filters with proper resource management.
 
         Args:
             filters: Dictionary of field:value filters (only safe column names allowed)
+            min_quality: Minimum quality score filter
 
         Returns:
             Number of matching recipes
@@ -594,6 +841,10 @@ class RecipeDatabase:
                     query_sql += f" AND {field} = ?"
                     params.append(value)
 
+        if min_quality is not None:
+            query_sql += " AND quality_score >= ?"
+            params.append(min_quality)
+
         with self._get_connection() as conn:
             cursor = conn.cursor()
             cursor.execute(query_sql, params)
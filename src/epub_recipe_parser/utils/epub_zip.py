@@ -0,0 +1,176 @@
+"""Streaming access to EPUB internals via zipfile.
+
+ebooklib's ``read_epub`` materializes every item's bytes (documents, images,
+fonts) before returning, so peak memory for a large cookbook is the whole
+unpacked book — multiplied by the worker count in parallel batch runs. Scans
+that only need one document at a time can instead read the OPF manifest
+straight out of the zip container and open members lazily, keeping peak
+memory at a single document.
+"""
+
+import posixpath
+import zipfile
+from pathlib import Path
+from typing import List, Optional, Tuple
+
+from lxml import etree
+
+_CONTAINER_PATH = "META-INF/container.xml"
+_CONTAINER_NS = {"c": "urn:oasis:names:tc:opendocument:xmlns:container"}
+_OPF_NS = {
+    "opf": "http://www.idpf.org/2007/opf",
+    "dc": "http://purl.org/dc/elements/1.1/",
+}
+_NCX_MEDIA_TYPE = "application/x-dtbncx+xml"
+DOCUMENT_MEDIA_TYPES = {"application/xhtml+xml", "text/html"}
+
+
+class EPUBZipReader:
+    """Read EPUB metadata and documents straight from the zip container.
+
+    Only the container descriptor and the OPF package document are parsed at
+    construction; document bytes are fetched on demand. Usable as a context
+    manager.
+    """
+
+    def __init__(self, epub_path: str | Path):
+        self._zf = zipfile.ZipFile(epub_path)
+        try:
+            container = etree.fromstring(self._zf.read(_CONTAINER_PATH))
+            rootfile = container.find(".//c:rootfile", _CONTAINER_NS)
+            if rootfile is None:
+                raise ValueError("No rootfile declared in container.xml")
+            opf_path = rootfile.get("full-path")
+            self._opf_dir = posixpath.dirname(opf_path)
+            self._opf = etree.fromstring(self._zf.read(opf_path))
+        except Exception:
+            self._zf.close()
+            raise
+
+    def __enter__(self) -> "EPUBZipReader":
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+    def close(self) -> None:
+        self._zf.close()
+
+    def metadata(self, tag: str) -> Optional[str]:
+        """Return the first DC metadata value (e.g. "title", "creator")."""
+        element = self._opf.find(f".//dc:{tag}", _OPF_NS)
+        return element.text if element is not None else None
+
+    def manifest_items(self) -> List[Tuple[str, str]]:
+        """Return (href, media_type) for every manifest item."""
+        return [
+            (item.get("href"), item.get("media-type") or "")
+            for item in self._opf.findall(".//opf:manifest/opf:item", _OPF_NS)
+        ]
+
+    def document_hrefs(self) -> List[str]:
+        """Return hrefs of content documents, in manifest order."""
+        return [
+            href for href, media_type in self.manifest_items() if media_type in DOCUMENT_MEDIA_TYPES
+        ]
+
+    def read(self, href: str) -> bytes:
+        """Read one manifest member's bytes (href is OPF-relative)."""
+        return self._zf.read(posixpath.normpath(posixpath.join(self._opf_dir, href)))
+
+    def open(self, href: str):
+        """Open one manifest member as a file object for streaming reads."""
+        return self._zf.open(posixpath.normpath(posixpath.join(self._opf_dir, href)))
+
+    def _ncx_href(self) -> Optional[str]:
+        return next(
+            (href for href, media_type in self.manifest_items() if media_type == _NCX_MEDIA_TYPE),
+            None,
+        )
+
+    def _nav_href(self) -> Optional[str]:
+        return next(
+            (
+                item.get("href")
+                for item in self._opf.findall(".//opf:manifest/opf:item", _OPF_NS)
+                if "nav" in (item.get("properties") or "").split()
+            ),
+            None,
+        )
+
+    def toc_entry_count(self) -> int:
+        """Count TOC entries from the NCX (EPUB 2) or nav document (EPUB 3)."""
+        ncx_href = self._ncx_href()
+        if ncx_href is not None:
+            try:
+                ncx = etree.fromstring(self.read(ncx_href))
+                return int(ncx.xpath("count(//*[local-name()='navPoint'])"))
+            except Exception:
+                return 0
+
+        nav_href = self._nav_href()
+        if nav_href is not None:
+            try:
+                nav = etree.fromstring(self.read(nav_href), parser=etree.HTMLParser())
+                return int(nav.xpath("count(//nav[1]//li)"))
+            except Exception:
+                return 0
+        return 0
+
+    def toc_entries(self) -> List[Tuple[str, Optional[str], int, Optional[str]]]:
+        """Return leaf TOC entries as (title, href, level, category) tuples.
+
+        Mirrors the shape ebooklib's ``book.toc`` traversal produces: nodes
+        with children act as categories for their descendants and only leaf
+        nodes become entries. Parses just the NCX or nav document, never the
+        content documents.
+        """
+        ncx_href = self._ncx_href()
+        if ncx_href is not None:
+            ncx = etree.fromstring(self.read(ncx_href))
+            entries: List[Tuple[str, Optional[str], int, Optional[str]]] = []
+
+            # local-name() predicates need full XPath (.xpath, as in
+            # toc_entry_count); ElementPath's find/findall rejects them
+            def walk_navpoint(navpoint, level: int, category: Optional[str]) -> None:
+                label = navpoint.xpath("./*[local-name()='navLabel']/*[local-name()='text']")
+                title = (label[0].text or "").strip() if label else ""
+                content = navpoint.xpath("./*[local-name()='content']")
+                href = content[0].get("src") if content else None
+                children = navpoint.xpath("./*[local-name()='navPoint']")
+                if children:
+                    for child in children:
+                        walk_navpoint(child, level + 1, title or category)
+                elif title:
+                    entries.append((title, href, level, category))
+
+            for navpoint in ncx.xpath(".//*[local-name()='navMap']/*[local-name()='navPoint']"):
+                walk_navpoint(navpoint, 0, None)
+            return entries
+
+        nav_href = self._nav_href()
+        if nav_href is None:
+            raise ValueError("No NCX or nav document in manifest")
+
+        nav = etree.fromstring(self.read(nav_href), parser=etree.HTMLParser())
+        navs = nav.xpath("//nav")
+        if not navs:
+            raise ValueError("nav document has no <nav> element")
+        entries = []
+
+        def walk_li(li, level: int, category: Optional[str]) -> None:
+            anchor = li.find("./a")
+            if anchor is None:
+                anchor = li.find("./span")
+            title = "".join(anchor.itertext()).strip() if anchor is not None else ""
+            href = anchor.get("href") if anchor is not None else None
+            sublist = li.find("./ol")
+            if sublist is not None:
+                for child in sublist.findall("./li"):
+                    walk_li(child, level + 1, title or category)
+            elif title:
+                entries.append((title, href, level, category))
+
+        for li in navs[0].xpath("./ol/li"):
+            walk_li(li, 0, None)
+        return entries
@@ -0,0 +1,129 @@
+"""Tests for streaming EPUB zip access."""
+
+import zipfile
+
+import pytest
+
+from epub_recipe_parser.utils.epub_zip import EPUBZipReader
+
+_CONTAINER_XML = """<?xml version="1.0"?>
+<container version="1.0" xmlns="urn:oasis:names:tc:opendocument:xmlns:container">
+  <rootfiles>
+    <rootfile full-path="OEBPS/content.opf" media-type="application/oebps-package+xml"/>
+  </rootfiles>
+</container>
+"""
+
+_OPF_EPUB2 = """<?xml version="1.0"?>
+<package xmlns="http://www.idpf.org/2007/opf" version="2.0" unique-identifier="id">
+  <metadata xmlns:dc="http://purl.org/dc/elements/1.1/">
+    <dc:title>Test Cookbook</dc:title>
+  </metadata>
+  <manifest>
+    <item id="ncx" href="toc.ncx" media-type="application/x-dtbncx+xml"/>
+    <item id="ch1" href="ch1.xhtml" media-type="application/xhtml+xml"/>
+  </manifest>
+  <spine toc="ncx"><itemref idref="ch1"/></spine>
+</package>
+"""
+
+_NCX = """<?xml version="1.0"?>
+<ncx xmlns="http://www.daisy.org/z3986/2005/ncx/" version="2005-1">
+  <navMap>
+    <navPoint id="n1"><navLabel><text>Mains</text></navLabel>
+      <content src="ch1.xhtml"/>
+      <navPoint id="n2"><navLabel><text>Grilled Chicken</text></navLabel>
+        <content src="ch1.xhtml#chicken"/>
+      </navPoint>
+      <navPoint id="n3"><navLabel><text>Beef Stew</text></navLabel>
+        <content src="ch1.xhtml#stew"/>
+      </navPoint>
+    </navPoint>
+    <navPoint id="n4"><navLabel><text>Index</text></navLabel>
+      <content src="ch1.xhtml#index"/>
+    </navPoint>
+  </navMap>
+</ncx>
+"""
+
+_OPF_EPUB3 = """<?xml version="1.0"?>
+<package xmlns="http://www.idpf.org/2007/opf" version="3.0" unique-identifier="id">
+  <metadata xmlns:dc="http://purl.org/dc/elements/1.1/">
+    <dc:title>Test Cookbook</dc:title>
+  </metadata>
+  <manifest>
+    <item id="nav" href="nav.xhtml" properties="nav" media-type="application/xhtml+xml"/>
+    <item id="ch1" href="ch1.xhtml" media-type="application/xhtml+xml"/>
+  </manifest>
+  <spine><itemref idref="ch1"/></spine>
+</package>
+"""
+
+_NAV = """<!DOCTYPE html>
+<html xmlns="http://www.w3.org/1999/xhtml">
+  <body>
+    <nav epub:type="toc" xmlns:epub="http://www.idpf.org/2007/ops">
+      <ol>
+        <li><span>Mains</span>
+          <ol>
+            <li><a href="ch1.xhtml#chicken">Grilled Chicken</a></li>
+            <li><a href="ch1.xhtml#stew">Beef Stew</a></li>
+          </ol>
+        </li>
+        <li><a href="ch1.xhtml#index">Index</a></li>
+      </ol>
+    </nav>
+  </body>
+</html>
+"""
+
+
+def _build_epub(path, opf, toc_name, toc_content):
+    with zipfile.ZipFile(path, "w") as zf:
+        zf.writestr("mimetype", "application/epub+zip")
+        zf.writestr("META-INF/container.xml", _CONTAINER_XML)
+        zf.writestr("OEBPS/content.opf", opf)
+        zf.writestr(f"OEBPS/{toc_name}", toc_content)
+        zf.writestr("OEBPS/ch1.xhtml", "<html><body><h2>Grilled Chicken</h2></body></html>")
+    return path
+
+
+@pytest.fixture
+def epub2_file(tmp_path):
+    """Minimal EPUB 2 book with an NCX table of contents."""
+    return _build_epub(tmp_path / "book2.epub", _OPF_EPUB2, "toc.ncx", _NCX)
+
+
+@pytest.fixture
+def epub3_file(tmp_path):
+    """Minimal EPUB 3 book with a nav document table of contents."""
+    return _build_epub(tmp_path / "book3.epub", _OPF_EPUB3, "nav.xhtml", _NAV)
+
+
+def test_toc_entries_ncx(epub2_file):
+    with EPUBZipReader(epub2_file) as reader:
+        entries = reader.toc_entries()
+
+    assert entries == [
+        ("Grilled Chicken", "ch1.xhtml#chicken", 1, "Mains"),
+        ("Beef Stew", "ch1.xhtml#stew", 1, "Mains"),
+        ("Index", "ch1.xhtml#index", 0, None),
+    ]
+
+
+def test_toc_entries_nav(epub3_file):
+    with EPUBZipReader(epub3_file) as reader:
+        entries = reader.toc_entries()
+
+    assert entries == [
+        ("Grilled Chicken", "ch1.xhtml#chicken", 1, "Mains"),
+        ("Beef Stew", "ch1.xhtml#stew", 1, "Mains"),
+        ("Index", "ch1.xhtml#index", 0, None),
+    ]
+
+
+def test_metadata_and_documents(epub2_file):
+    with EPUBZipReader(epub2_file) as reader:
+        assert reader.metadata("title") == "Test Cookbook"
+        assert reader.document_hrefs() == ["ch1.xhtml"]
+        assert b"Grilled Chicken" in reader.read("ch1.xhtml")